@@ -81,10 +81,13 @@ class IIndexRepository(Protocol):
         ext: Optional[str] = None,
         min_size: Optional[int] = None,
         max_size: Optional[int] = None,
-        order_by: str = "path"
+        order_by: str = "path",
+        after_id: Optional[int] = None
     ) -> list[FileEntry]:
         """파일 목록 조회 (페이지네이션).
         
+        ``after_id``를 주면 키셋 페이지네이션 (``file_id`` 오름차순, offset/order_by 무시).
+        
         Args:
             run_id: Run ID.
             offset: 시작 오프셋 (기본값: 0).
@@ -93,6 +96,7 @@ class IIndexRepository(Protocol):
             min_size: 최소 크기 필터 (선택적, 바이트).
             max_size: 최대 크기 필터 (선택적, 바이트).
             order_by: 정렬 기준 (기본값: "path", 허용: "path", "size_desc", "mtime_desc").
+            after_id: 이전 페이지의 마지막 file_id (선택적).
         
         Returns:
             파일 엔트리 리스트.
@@ -5,7 +5,7 @@
 1 file_id → 1 group_id를 보장합니다.
 """
 from collections import defaultdict
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Iterable, Optional, TYPE_CHECKING
 
 from application.dto.duplicate_group_result import DuplicateGroupResult
 
@@ -16,20 +16,23 @@ if TYPE_CHECKING:
 class _UnionFind:
     """Union-Find (Disjoint Set) 자료구조.
     
-    경로 압축과 union-by-rank를 사용하여 효율적인 집합 연산을 제공합니다.
+    요소를 0..n-1 인덱스로 매핑해 부모/크기를 평탄한 리스트로 관리한다.
+    경로 반감(path halving)과 union-by-size를 사용하여 효율적인 집합 연산을 제공합니다.
     """
     
-    def __init__(self, elements: set[int]) -> None:
+    def __init__(self, elements: Iterable[int]) -> None:
         """Union-Find 초기화.
         
         Args:
-            elements: 초기 요소 집합.
+            elements: 초기 요소들.
         """
-        self._parent: dict[int, int] = {x: x for x in elements}
-        self._rank: dict[int, int] = {x: 0 for x in elements}
+        self._elements: list[int] = list(elements)
+        self._index: dict[int, int] = {x: i for i, x in enumerate(self._elements)}
+        self._parent: list[int] = list(range(len(self._elements)))
+        self._size: list[int] = [1] * len(self._elements)
     
     def find(self, x: int) -> int:
-        """요소 x의 루트를 찾습니다 (경로 압축).
+        """요소 x의 루트를 찾습니다 (경로 반감).
         
         Args:
             x: 찾을 요소.
@@ -37,31 +40,34 @@ class _UnionFind:
         Returns:
             요소 x의 루트.
         """
-        if self._parent[x] != x:
-            self._parent[x] = self.find(self._parent[x])  # 경로 압축
-        return self._parent[x]
+        return self._elements[self._find(self._index[x])]
+    
+    def _find(self, i: int) -> int:
+        """인덱스 i의 루트 인덱스 (반복문 기반 경로 반감)."""
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # 경로 반감: 조부모로 건너뛰기
+            i = parent[i]
+        return i
     
     def union(self, x: int, y: int) -> None:
-        """두 요소를 같은 집합으로 병합 (union-by-rank).
+        """두 요소를 같은 집합으로 병합 (union-by-size).
         
         Args:
             x: 첫 번째 요소.
             y: 두 번째 요소.
         """
-        root_x = self.find(x)
-        root_y = self.find(y)
+        root_x = self._find(self._index[x])
+        root_y = self._find(self._index[y])
         
         if root_x == root_y:
             return  # 이미 같은 집합
         
-        # union-by-rank: rank가 낮은 트리를 높은 트리에 연결
-        if self._rank[root_x] < self._rank[root_y]:
-            self._parent[root_x] = root_y
-        elif self._rank[root_x] > self._rank[root_y]:
-            self._parent[root_y] = root_x
-        else:
-            self._parent[root_y] = root_x
-            self._rank[root_x] += 1
+        # union-by-size: 작은 트리를 큰 트리에 연결
+        if self._size[root_x] < self._size[root_y]:
+            root_x, root_y = root_y, root_x
+        self._parent[root_y] = root_x
+        self._size[root_x] += self._size[root_y]
     
     def get_components(self) -> dict[int, list[int]]:
         """모든 연결 요소를 반환.
@@ -70,9 +76,9 @@ class _UnionFind:
             {root_id: [component_file_ids]} 딕셔너리.
         """
         components: dict[int, list[int]] = defaultdict(list)
-        for element in self._parent:
-            root = self.find(element)
-            components[root].append(element)
+        elements = self._elements
+        for i, element in enumerate(elements):
+            components[elements[self._find(i)]].append(element)
         return dict(components)
 
 
@@ -5,9 +5,12 @@ from pathlib import Path
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileEntry:
-    """파일 엔티티 - 스캔 결과로 생성되는 불변 객체."""
+    """파일 엔티티 - 스캔 결과로 생성되는 불변 객체.
+    
+    스캔 시 파일마다 생성되므로 ``__slots__`` 기반으로 인스턴스 ``__dict__``를 두지 않는다.
+    """
     
     path: Path
     """파일 경로."""
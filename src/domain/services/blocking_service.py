@@ -50,6 +50,10 @@ class BlockingService:
             2차 Blocking: range_start가 있으면 (extension, series_title_norm, range_start)로 세분화
             3차 Blocking: range_unit이 다르면 분리 (권 vs 화)
         """
+        # 파일이 2개 미만이면 그룹이 생길 수 없으므로 그룹화 자료구조를 만들지 않음
+        if len(files) < 2:
+            return []
+        
         # 1차 그룹화: (extension, series_title_norm)
         # confidence가 낮은 파싱 결과는 blocking에서 제외 (폭증 방지)
         MIN_CONFIDENCE_FOR_BLOCKING = 0.7
@@ -1,4 +1,5 @@
 """Exact 중복 탐지 서비스."""
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional, Protocol
 
@@ -86,12 +87,10 @@ class ExactDuplicateDetector:
             ExactDuplicateRelation 리스트.
         """
         # 같은 크기의 파일들끼리만 비교
-        size_groups: dict[int, list[int]] = {}
+        size_groups: dict[int, list[int]] = defaultdict(list)
         for file_id in blocking_group.file_ids:
-            if file_id in file_entries:
-                file_entry = file_entries[file_id]
-                if file_entry.size not in size_groups:
-                    size_groups[file_entry.size] = []
+            file_entry = file_entries.get(file_id)
+            if file_entry is not None:
                 size_groups[file_entry.size].append(file_id)
         
         exact_relations = []
@@ -141,17 +140,12 @@ class ExactDuplicateDetector:
         file_entries: dict[int, FileEntry]
     ) -> dict[str, list[int]]:
         """Prefix hash로 그룹화."""
-        groups: dict[str, list[int]] = {}
+        groups: dict[str, list[int]] = defaultdict(list)
         
         for file_id in file_ids:
-            file_entry = file_entries[file_id]
-            prefix_hash = self._hash_service.calculate_prefix_hash(file_entry.path)
-            
-            if prefix_hash not in groups:
-                groups[prefix_hash] = []
-            groups[prefix_hash].append(file_id)
+            groups[self._hash_service.calculate_prefix_hash(file_entries[file_id].path)].append(file_id)
         
-        return groups
+        return dict(groups)
     
     def _group_by_suffix_hash(
         self,
@@ -159,17 +153,12 @@ class ExactDuplicateDetector:
         file_entries: dict[int, FileEntry]
     ) -> dict[str, list[int]]:
         """Suffix hash로 그룹화."""
-        groups: dict[str, list[int]] = {}
+        groups: dict[str, list[int]] = defaultdict(list)
         
         for file_id in file_ids:
-            file_entry = file_entries[file_id]
-            suffix_hash = self._hash_service.calculate_suffix_hash(file_entry.path)
-            
-            if suffix_hash not in groups:
-                groups[suffix_hash] = []
-            groups[suffix_hash].append(file_id)
+            groups[self._hash_service.calculate_suffix_hash(file_entries[file_id].path)].append(file_id)
         
-        return groups
+        return dict(groups)
     
     def _group_by_full_hash(
         self,
@@ -177,15 +166,10 @@ class ExactDuplicateDetector:
         file_entries: dict[int, FileEntry]
     ) -> dict[str, list[int]]:
         """Full hash로 그룹화."""
-        groups: dict[str, list[int]] = {}
+        groups: dict[str, list[int]] = defaultdict(list)
         
         for file_id in file_ids:
-            file_entry = file_entries[file_id]
-            full_hash = self._hash_service.calculate_hash(file_entry.path)
-            
-            if full_hash not in groups:
-                groups[full_hash] = []
-            groups[full_hash].append(file_id)
+            groups[self._hash_service.calculate_hash(file_entries[file_id].path)].append(file_id)
         
-        return groups
+        return dict(groups)
 
@@ -1,5 +1,6 @@
 """파일명 파싱 서비스."""
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -10,6 +11,39 @@ if TYPE_CHECKING:
     from application.ports.log_sink import ILogSink
 
 
+# 태그 제거용 패턴 (모듈 로드 시 한 번만 컴파일)
+_BRACKET_TAG_RE = re.compile(r'[\(\[].*?[\)\]]')  # (태그), [태그]
+_AT_TAG_RE = re.compile(r'@[^\s]+')  # @태그
+_RANGE_RE = re.compile(r'(\d+)\s*[-~]\s*(\d+)')  # 휴리스틱 숫자 범위
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 완결 태그 단어 기반 제거 (문자 클래스가 아닌 alternation 사용)
+# 주의: [완결完후기에필]+ 같은 문자 클래스는 개별 문자를 삭제하므로
+# 서로 다른 작품명이 같은 normalized로 뭉개질 수 있음
+_TAG_WORDS_RE = re.compile(
+    r'(완결|완전판|완본|완|完|후기|에필로그|에필|epilogue|afterword|complete|finished|end)',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_title_cached(title: str) -> str:
+    """작품명 정규화 (순수 함수, 같은 작품명은 캐시).
+    
+    같은 작품의 여러 파일은 같은 작품명 문자열을 가지므로 캐시 적중률이 높다.
+    """
+    # 태그 제거
+    normalized = _BRACKET_TAG_RE.sub('', title)
+    normalized = _AT_TAG_RE.sub('', normalized)
+    normalized = _TAG_WORDS_RE.sub('', normalized)
+    
+    # 공백 정리
+    normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
+    
+    # 소문자 변환 (한글은 영향 없음)
+    return normalized.lower()
+
+
 class FilenameParser:
     """파일명 파싱 서비스.
     
@@ -259,7 +293,7 @@ class FilenameParser:
     def _parse_with_heuristics(self, filename: str, path: Path) -> FilenameParseResult:
         """휴리스틱으로 파싱."""
         # 숫자 범위 찾기 (예: "1-170", "0-59")
-        range_match = re.search(r'(\d+)\s*[-~]\s*(\d+)', filename)
+        range_match = _RANGE_RE.search(filename)
         if range_match:
             range_start = int(range_match.group(1))
             range_end = int(range_match.group(2))
@@ -308,8 +342,8 @@ class FilenameParser:
     def _parse_fallback(self, filename: str, path: Path) -> FilenameParseResult:
         """폴백 파싱 (작품명만 추출)."""
         # 태그 제거 시도
-        cleaned = re.sub(r'[\(\[].*?[\)\]]', '', filename)  # (태그), [태그] 제거
-        cleaned = re.sub(r'@[^\s]+', '', cleaned)  # @태그 제거
+        cleaned = _BRACKET_TAG_RE.sub('', filename)  # (태그), [태그] 제거
+        cleaned = _AT_TAG_RE.sub('', cleaned)  # @태그 제거
         cleaned = cleaned.strip()
         
         series_title_norm = self._normalize_series_title(cleaned if cleaned else filename)
@@ -334,26 +368,7 @@ class FilenameParser:
         Returns:
             정규화된 작품명 (소문자, 공백 정리, 태그 제거).
         """
-        # 태그 제거
-        normalized = re.sub(r'[\(\[].*?[\)\]]', '', title)  # (태그), [태그] 제거
-        normalized = re.sub(r'@[^\s]+', '', normalized)  # @태그 제거
-        
-        # 완결 태그 단어 기반 제거 (문자 클래스가 아닌 alternation 사용)
-        # 주의: [완결完후기에필]+ 같은 문자 클래스는 개별 문자를 삭제하므로
-        # 서로 다른 작품명이 같은 normalized로 뭉개질 수 있음
-        tag_words_pattern = re.compile(
-            r'(완결|완전판|완본|완|完|후기|에필로그|에필|epilogue|afterword|complete|finished|end)',
-            re.IGNORECASE
-        )
-        normalized = tag_words_pattern.sub('', normalized)
-        
-        # 공백 정리
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        
-        # 소문자 변환 (한글은 영향 없음)
-        normalized = normalized.lower()
-        
-        return normalized
+        return _normalize_title_cached(title)
     
     def _extract_tags(self, text: str) -> list[str]:
         """태그 추출.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContainmentRelation:
     """포함 관계 - 하나의 파일이 다른 파일의 범위를 포함하는 관계."""
     
@@ -28,7 +28,7 @@ class ContainmentRelation:
             raise ValueError("container_file_id and contained_file_id must be different")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VersionRelation:
     """버전 관계 - 같은 파일의 업데이트/확장 버전."""
     
@@ -53,7 +53,7 @@ class VersionRelation:
             raise ValueError("newer_file_id and older_file_id must be different")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExactDuplicateRelation:
     """Exact 중복 관계 - 내용이 100% 동일한 파일."""
     
@@ -75,7 +75,7 @@ class ExactDuplicateRelation:
             raise ValueError("file_ids must not contain duplicates")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NearDuplicateRelation:
     """Near 중복 관계 - 내용이 거의 동일한 파일 (유사도 기반)."""
     
@@ -6,12 +6,13 @@ from typing import Optional
 from domain.value_objects.range_segment import RangeSegment
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FilenameParseResult:
     """파일명 파싱 결과.
     
     파일명에서 추출한 작품명, 범위, 태그 정보를 담는 불변 객체.
     중복 탐지의 핵심 데이터로 사용됨.
+    파일마다 하나씩 생성되므로 ``__slots__`` 기반으로 인스턴스 ``__dict__``를 두지 않는다.
     """
     
     # 원본
@@ -87,9 +88,8 @@ class FilenameParseResult:
         
         # segments와 range_start/end/unit 일관성 확인
         if self.segments:
-            primary_segments = [s for s in self.segments if s.is_primary]
-            if primary_segments:
-                primary = primary_segments[0]
+            primary = next((s for s in self.segments if s.is_primary), None)
+            if primary is not None:
                 if self.range_start is not None and self.range_start != primary.start:
                     raise ValueError(
                         f"range_start ({self.range_start}) must match primary segment start ({primary.start})"
@@ -125,8 +125,7 @@ class FilenameParseResult:
         Returns:
             Primary segment. 없으면 None.
         """
-        primary_segments = [s for s in self.segments if s.is_primary]
-        return primary_segments[0] if primary_segments else None
+        return next((s for s in self.segments if s.is_primary), None)
     
     @property
     def total_coverage(self) -> int:
@@ -1,27 +1,49 @@
 """Preview 스캔 통계 ValueObject."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PreviewStats:
     """Preview 스캔 통계 정보.
     
     폴더 선택 직후 빠른 미리보기 정보를 담는 불변 객체.
     파일 수와 확장자 분포만 포함하며, 실제 파일 메타데이터는 포함하지 않음.
+    ``__slots__`` 기반이라 인스턴스 ``__dict__``가 없다.
     """
     
     estimated_total_files: int
     """예상 총 파일 수."""
     
     top_extensions: dict[str, int]
-    """확장자별 파일 수. {'.txt': 70, '.md': 30} 형식."""
+    """확장자별 파일 수. {'.txt': 70, '.md': 30} 형식 (생성 시 사본으로 보관)."""
     
     estimated_bytes: Optional[int] = None
     """예상 총 바이트 수 (선택적)."""
     
+    has_size_estimate: bool = field(init=False, repr=False, compare=False)
+    """크기 추정 정보가 있는지 여부."""
+    
+    is_empty: bool = field(init=False, repr=False, compare=False)
+    """파일이 없는지 여부."""
+    
+    extension_count: int = field(init=False, repr=False, compare=False)
+    """확장자 종류 수."""
+    
+    _ext_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    """파일 수 내림차순으로 정렬된 확장자 (생성 시 1회 계산)."""
+    
+    _ext_counts: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    """``_ext_names``와 같은 순서의 파일 수."""
+    
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    """캐시된 해시 값 (최초 ``hash()`` 호출 시 계산)."""
+    
     def __post_init__(self) -> None:
         """유효성 검증."""
+        # 파생 값이 입력 dict 변경과 어긋나지 않도록 사본을 보관
+        object.__setattr__(self, "top_extensions", dict(self.top_extensions))
+        
         if self.estimated_total_files < 0:
             raise ValueError("estimated_total_files must be >= 0")
         
@@ -31,21 +53,45 @@ class PreviewStats:
         for ext, count in self.top_extensions.items():
             if count < 0:
                 raise ValueError(f"Extension count '{ext}' must be >= 0")
+        
+        # 불변 객체이므로 파생 값은 생성 시 한 번만 계산
+        object.__setattr__(self, "has_size_estimate", self.estimated_bytes is not None)
+        object.__setattr__(self, "is_empty", self.estimated_total_files == 0)
+        object.__setattr__(self, "extension_count", len(self.top_extensions))
+        
+        # 정렬은 생성 시 한 번만 수행 (동률은 입력 순서 유지)
+        sorted_items = sorted(
+            self.top_extensions.items(),
+            key=lambda x: x[1],
+            reverse=True
+        )
+        object.__setattr__(self, "_ext_names", tuple(ext for ext, _ in sorted_items))
+        object.__setattr__(self, "_ext_counts", tuple(count for _, count in sorted_items))
     
-    @property
-    def has_size_estimate(self) -> bool:
-        """크기 추정 정보가 있는지 여부."""
-        return self.estimated_bytes is not None
-    
-    @property
-    def is_empty(self) -> bool:
-        """파일이 없는지 여부."""
-        return self.estimated_total_files == 0
+    def __hash__(self) -> int:
+        """해시 값 (최초 계산 후 캐시).
+        
+        ``top_extensions``는 dict라 그대로 해시할 수 없으므로 항목의
+        frozenset을 사용한다 (dict 동등성과 같이 순서 무관).
+        """
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((
+                self.estimated_total_files,
+                frozenset(self.top_extensions.items()),
+                self.estimated_bytes,
+            )))
+        return self._hash
     
-    @property
-    def extension_count(self) -> int:
-        """확장자 종류 수."""
-        return len(self.top_extensions)
+    def __reduce__(self) -> tuple:
+        """pickle/copy 지원 (생성자로 재구성).
+        
+        문자열 해시는 프로세스마다 달라지므로 캐시된 해시와 파생 값은
+        복원하지 않고 생성 시 다시 계산한다.
+        """
+        return (
+            type(self),
+            (self.estimated_total_files, dict(self.top_extensions), self.estimated_bytes),
+        )
     
     def get_most_common_extension(self) -> Optional[str]:
         """가장 많은 확장자 반환.
@@ -53,10 +99,10 @@ class PreviewStats:
         Returns:
             가장 많은 확장자 ('.txt' 형식). 파일이 없으면 None.
         """
-        if not self.top_extensions:
+        if not self._ext_names:
             return None
         
-        return max(self.top_extensions.items(), key=lambda x: x[1])[0]
+        return self._ext_names[0]
     
     def get_extension_percentage(self, extension: str) -> float:
         """확장자 비율 계산.
@@ -93,9 +139,4 @@ class PreviewStats:
         Returns:
             (확장자, 파일 수) 튜플 리스트. 파일 수 기준 내림차순 정렬.
         """
-        sorted_exts = sorted(
-            self.top_extensions.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        return sorted_exts[:limit]
+        return list(zip(self._ext_names[:limit], self._ext_counts[:limit], strict=True))
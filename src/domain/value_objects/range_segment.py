@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RangeSegment:
     """범위 세그먼트 - 복합 범위의 일부 (본편/외전/에필 등).
     
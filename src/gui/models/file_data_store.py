@@ -221,23 +221,21 @@ class FileDataStore(QObject):
         if not entries:
             return []
         
-        file_data_list = []
-        for entry in entries:
-            file_id = self._next_file_id
-            self._next_file_id += 1
-            
-            file_data = FileData(
-                entry=entry,
-                file_id=file_id
-            )
-            
-            self._files[file_id] = file_data
-            
+        # 배치 크기만큼 ID를 한 번에 할당하고 리스트는 컴프리헨션으로 한 번에 생성
+        start_id = self._next_file_id
+        self._next_file_id += len(entries)
+        file_data_list = [
+            FileData(entry=entry, file_id=file_id)
+            for file_id, entry in enumerate(entries, start_id)
+        ]
+
+        files = self._files
+        path_to_id = self._path_to_id
+        normalize_path_key = self._normalize_path_key
+        for file_data in file_data_list:
+            files[file_data.file_id] = file_data
             # 경로 인덱스 추가 (정규화)
-            path_key = self._normalize_path_key(entry.path)
-            self._path_to_id[path_key] = file_id
-            
-            file_data_list.append(file_data)
+            path_to_id[normalize_path_key(file_data.entry.path)] = file_data.file_id
         
         # 배치 시그널만 emit (개별 시그널은 emit하지 않음)
         self.files_added_batch.emit(file_data_list)
@@ -16,6 +16,7 @@ from PySide6.QtWidgets import (
 )
 
 from application.use_cases.move_duplicate_files import MoveOperation
+from gui.views.components.size_format import format_file_size
 
 
 class DryRunPreviewDialog(QDialog):
@@ -104,7 +105,7 @@ class DryRunPreviewDialog(QDialog):
             # 크기
             try:
                 size_bytes = operation.source_path.stat().st_size
-                size_text = self._format_file_size(size_bytes)
+                size_text = format_file_size(size_bytes)
                 size_item = QTableWidgetItem(size_text)
                 size_item.setData(Qt.UserRole, size_bytes)  # 정렬을 위한 원본 값
             except Exception:
@@ -123,29 +124,3 @@ class DryRunPreviewDialog(QDialog):
         button_box = QDialogButtonBox(QDialogButtonBox.Ok)
         button_box.accepted.connect(self.accept)
         layout.addWidget(button_box)
-    
-    def _format_file_size(self, size_bytes: int) -> str:
-        """파일 크기를 사람이 읽기 쉬운 형식으로 변환.
-        
-        Args:
-            size_bytes: 파일 크기 (바이트).
-        
-        Returns:
-            포맷된 크기 문자열 (예: "1.5 KB", "2.3 MB").
-        """
-        if size_bytes == 0:
-            return "0 B"
-        
-        units = ["B", "KB", "MB", "GB", "TB"]
-        unit_index = 0
-        size = float(size_bytes)
-        
-        from app.settings.constants import Constants
-        while size >= Constants.BYTES_PER_KB and unit_index < len(units) - 1:
-            size /= Constants.BYTES_PER_KB
-            unit_index += 1
-        
-        if unit_index == 0:
-            return f"{int(size)} {units[unit_index]}"
-        else:
-            return f"{size:.2f} {units[unit_index]}"
@@ -2,6 +2,7 @@
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from PySide6.QtCore import Qt, QTimer
@@ -17,24 +18,56 @@ from PySide6.QtWidgets import (
 
 from gui.models.file_data_store import FileData, FileDataStore
 from gui.views.components.file_list_constants import FileListColumns, FileListRoles, FileListUpdatePolicy
+from gui.views.components.size_format import format_file_size
 
 logger = logging.getLogger(__name__)
 
 
+# 파일명에서 타이틀 추출용 정규식 패턴
+_TITLE_EXTRACT_PATTERNS = (
+    re.compile(r'\s+\d+\s*[-~]\s*\d+.*$'),  # " 1-176" 또는 " 1~176" 형식
+    re.compile(r'\s+\d+[화권장회부].*$'),  # " 1화", " 1권" 등
+    re.compile(r'\s+본편\s+\d+.*$'),  # " 본편 1-1213" 등
+    re.compile(r'\s+외전\s+\d+.*$'),  # " 외전 1-71" 등
+)
+
+# 태그 패턴 (예: "(완)", "[에필]", "@태그")
+_TAG_STRIP_PATTERNS = (
+    re.compile(r'\([^)]*\)'),  # (태그)
+    re.compile(r'\[[^\]]*\]'),  # [태그]
+    re.compile(r'@[^\s]+'),  # @태그
+)
+
+
+@lru_cache(maxsize=2048)
+def _extract_title_cached(filename: str) -> str:
+    """파일명에서 소설 타이틀 추출 (순수 함수, 같은 파일명은 캐시).
+    
+    paint 이벤트마다 호출되므로 같은 행을 다시 그릴 때 정규식을 재실행하지 않는다.
+    """
+    # 확장자 제거
+    name = filename.rsplit('.', 1)[0] if '.' in filename else filename
+    
+    # 회차 범위 패턴 제거
+    for pattern in _TITLE_EXTRACT_PATTERNS:
+        name = pattern.sub('', name)
+    
+    # 태그 패턴 제거
+    for pattern in _TAG_STRIP_PATTERNS:
+        name = pattern.sub('', name)
+    
+    # 양쪽 공백 제거
+    title = name.strip()
+    
+    return title if title else filename  # 추출 실패 시 원본 반환
+
+
 class DuplicateColumnsDelegate(QStyledItemDelegate):
     """중복 그룹, 대표 파일 컬럼을 FileData에서 직접 렌더링.
     
     setText() 호출 없이 paint 이벤트에서 FileData를 읽어 표시 문자열을 생성합니다.
     """
     
-    # 파일명에서 타이틀 추출용 정규식 패턴
-    _TITLE_EXTRACT_PATTERNS = [
-        re.compile(r'\s+\d+\s*[-~]\s*\d+.*$'),  # " 1-176" 또는 " 1~176" 형식
-        re.compile(r'\s+\d+[화권장회부].*$'),  # " 1화", " 1권" 등
-        re.compile(r'\s+본편\s+\d+.*$'),  # " 본편 1-1213" 등
-        re.compile(r'\s+외전\s+\d+.*$'),  # " 외전 1-71" 등
-    ]
-    
     def _extract_title_from_filename(self, filename: str) -> str:
         """파일명에서 소설 타이틀을 추출.
         
@@ -44,22 +77,7 @@ class DuplicateColumnsDelegate(QStyledItemDelegate):
         Returns:
             추출된 타이틀.
         """
-        # 확장자 제거
-        name = filename.rsplit('.', 1)[0] if '.' in filename else filename
-        
-        # 회차 범위 패턴 제거
-        for pattern in self._TITLE_EXTRACT_PATTERNS:
-            name = pattern.sub('', name)
-        
-        # 태그 패턴 제거 (예: "(완)", "[에필]", "@태그")
-        name = re.sub(r'\([^)]*\)', '', name)  # (태그)
-        name = re.sub(r'\[[^\]]*\]', '', name)  # [태그]
-        name = re.sub(r'@[^\s]+', '', name)  # @태그
-        
-        # 양쪽 공백 제거
-        title = name.strip()
-        
-        return title if title else filename  # 추출 실패 시 원본 반환
+        return _extract_title_cached(filename)
     
     def initStyleOption(self, option, index):
         """스타일 옵션 초기화. FileData에서 값을 읽어 표시 텍스트를 설정."""
@@ -415,7 +433,7 @@ class FileListTableWidget(QWidget):
         self._table.setItem(row, FileListColumns.FILE_PATH, path_item)
         
         # 크기
-        size_item = QTableWidgetItem(self._format_file_size(file_data.size))
+        size_item = QTableWidgetItem(format_file_size(file_data.size))
         size_item.setData(FileListRoles.SORT_VALUE, file_data.size)  # 정렬을 위한 원본 값
         self._table.setItem(row, FileListColumns.FILE_SIZE, size_item)
         
@@ -473,32 +491,6 @@ class FileListTableWidget(QWidget):
         attr_item = QTableWidgetItem(attr_text)
         self._table.setItem(row, FileListColumns.ATTRIBUTES, attr_item)
     
-    def _format_file_size(self, size_bytes: int) -> str:
-        """파일 크기를 사람이 읽기 쉬운 형식으로 변환.
-        
-        Args:
-            size_bytes: 파일 크기 (바이트).
-        
-        Returns:
-            포맷된 크기 문자열 (예: "1.5 KB", "2.3 MB").
-        """
-        if size_bytes == 0:
-            return "0 B"
-        
-        units = ["B", "KB", "MB", "GB", "TB"]
-        unit_index = 0
-        size = float(size_bytes)
-        
-        from app.settings.constants import Constants
-        while size >= Constants.BYTES_PER_KB and unit_index < len(units) - 1:
-            size /= Constants.BYTES_PER_KB
-            unit_index += 1
-        
-        if unit_index == 0:
-            return f"{int(size)} {units[unit_index]}"
-        else:
-            return f"{size:.2f} {units[unit_index]}"
-    
     def _format_datetime(self, dt: datetime) -> str:
         """날짜/시간을 문자열로 변환.
         
@@ -0,0 +1,30 @@
+"""파일 크기 표시 형식 헬퍼.
+
+파일 목록 테이블과 Dry Run 미리보기가 공유한다. 통계 탭과 중복 그룹 파일
+테이블은 소수점 1자리 요약 표기를 쓰므로 각자의 포맷터를 유지한다.
+"""
+from app.settings.constants import Constants
+
+# 파일 크기 표시 단위 (BYTES_PER_KB배씩 증가)
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def format_file_size(size_bytes: int) -> str:
+    """파일 크기를 사람이 읽기 쉬운 형식으로 변환.
+    
+    Args:
+        size_bytes: 파일 크기 (바이트).
+    
+    Returns:
+        포맷된 크기 문자열 (예: "512 B", "1.50 KB", "2.30 MB").
+    """
+    if size_bytes < Constants.BYTES_PER_KB:
+        return f"{size_bytes} B"
+    
+    size = float(size_bytes)
+    unit_index = 0
+    while size >= Constants.BYTES_PER_KB and unit_index < len(_SIZE_UNITS) - 1:
+        size /= Constants.BYTES_PER_KB
+        unit_index += 1
+    
+    return f"{size:.2f} {_SIZE_UNITS[unit_index]}"
@@ -45,14 +45,38 @@ CREATE_INDEX_RUN_PATH = """
 CREATE INDEX IF NOT EXISTS idx_files_run_path ON files(run_id, path)
 """
 
+# 키셋 페이지네이션 (WHERE run_id = ? AND file_id > ? ORDER BY file_id)용
+CREATE_INDEX_RUN_FILE_ID = """
+CREATE INDEX IF NOT EXISTS idx_files_run_file_id ON files(run_id, file_id)
+"""
+
 # Upsert 정책: INSERT ... ON CONFLICT DO UPDATE
-# 이 SQL은 sqlite_index_repository.py에서 동적으로 생성하여 사용
-# 예시:
-# INSERT INTO files (run_id, path, size, mtime, ext, is_hidden, is_symlink)
-# VALUES (?, ?, ?, ?, ?, ?, ?)
-# ON CONFLICT(run_id, path) DO UPDATE SET
-#     size = excluded.size,
-#     mtime = excluded.mtime,
-#     ext = excluded.ext,
-#     is_hidden = excluded.is_hidden,
-#     is_symlink = excluded.is_symlink
+# REPLACE(DELETE+INSERT)와 달리 file_id와 인덱스 항목을 유지한 채 갱신
+UPSERT_FILES = """
+INSERT INTO files (run_id, path, size, mtime, ext, is_hidden, is_symlink)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(run_id, path) DO UPDATE SET
+    size = excluded.size,
+    mtime = excluded.mtime,
+    ext = excluded.ext,
+    is_hidden = excluded.is_hidden,
+    is_symlink = excluded.is_symlink
+"""
+
+# 확장자별 분포 집계 ((run_id, ext) 인덱스 사용)
+SELECT_EXT_DISTRIBUTION = """
+SELECT ext, COUNT(*) as count, SUM(size) as total_bytes
+FROM files
+WHERE run_id = ?
+GROUP BY ext
+ORDER BY count DESC
+"""
+
+# 파일 목록 조회 (WHERE/ORDER BY/페이지 절은 저장소가 채움)
+SELECT_FILES_TEMPLATE = """
+SELECT file_id, path, size, mtime, ext, is_hidden, is_symlink
+FROM files
+WHERE {where_clause}
+ORDER BY {order_by}
+{page_clause}
+"""
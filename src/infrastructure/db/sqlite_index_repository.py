@@ -20,6 +20,10 @@ from infrastructure.db.schema import (
     CREATE_INDEX_RUN_EXT,
     CREATE_INDEX_RUN_SIZE,
     CREATE_INDEX_RUN_PATH,
+    CREATE_INDEX_RUN_FILE_ID,
+    UPSERT_FILES,
+    SELECT_EXT_DISTRIBUTION,
+    SELECT_FILES_TEMPLATE,
 )
 
 
@@ -57,8 +61,11 @@ class SQLiteIndexRepository:
                 CREATE_TABLE_FILES + ";\n" +
                 CREATE_INDEX_RUN_EXT + ";\n" +
                 CREATE_INDEX_RUN_SIZE + ";\n" +
-                CREATE_INDEX_RUN_PATH + ";\n"
+                CREATE_INDEX_RUN_PATH + ";\n" +
+                CREATE_INDEX_RUN_FILE_ID + ";\n"
             )
+            # WAL 모드는 DB 파일에 유지되므로 스키마 생성 시 한 번만 설정
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript(schema_sql)
             conn.commit()
         finally:
@@ -67,10 +74,18 @@ class SQLiteIndexRepository:
     def _connect(self) -> sqlite3.Connection:
         """DB 커넥션 생성 (메서드 호출마다 새 커넥션).
         
+        커넥션 단위 PRAGMA를 적용한다 (WAL에서는 synchronous=NORMAL로도 안전).
+        
         Returns:
             SQLite 커넥션.
         """
-        return sqlite3.connect(str(self._db_path))
+        conn = sqlite3.connect(str(self._db_path))
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64MB (음수는 KiB 단위)
+        # 커넥션마다 페이지 캐시가 비므로 읽기는 OS 페이지 캐시를 mmap으로 직접 사용
+        conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+        return conn
     
     def start_run(self, request: ScanRequest) -> int:
         """Run 시작.
@@ -147,25 +162,30 @@ class SQLiteIndexRepository:
             }
         )
         
-        # 청크 단위로 처리
+        # 청크 단위로 처리 (커넥션/트랜잭션은 전체 배치에 하나)
         chunk_count = 0
-        for chunk_start in range(0, len(entries), self.CHUNK_SIZE):
-            chunk = entries[chunk_start:chunk_start + self.CHUNK_SIZE]
-            self._upsert_files_chunk(run_id, chunk)
-            chunk_count += 1
-            
-            # 청크 완료 로그 (매 5개 청크마다)
-            if chunk_count % 5 == 0:
-                debug_step(
-                    self._log_sink,
-                    "upsert_files_progress",
-                    {
-                        "run_id": run_id,
-                        "chunks_processed": chunk_count,
-                        "entries_processed": min(chunk_start + self.CHUNK_SIZE, len(entries)),
-                        "total_entries": len(entries),
-                    }
-                )
+        conn = self._connect()
+        try:
+            with conn:  # 트랜잭션
+                for chunk_start in range(0, len(entries), self.CHUNK_SIZE):
+                    chunk = entries[chunk_start:chunk_start + self.CHUNK_SIZE]
+                    self._upsert_files_chunk(conn, run_id, chunk)
+                    chunk_count += 1
+                    
+                    # 청크 완료 로그 (매 5개 청크마다)
+                    if chunk_count % 5 == 0:
+                        debug_step(
+                            self._log_sink,
+                            "upsert_files_progress",
+                            {
+                                "run_id": run_id,
+                                "chunks_processed": chunk_count,
+                                "entries_processed": min(chunk_start + self.CHUNK_SIZE, len(entries)),
+                                "total_entries": len(entries),
+                            }
+                        )
+        finally:
+            conn.close()
         
         debug_step(
             self._log_sink,
@@ -177,44 +197,35 @@ class SQLiteIndexRepository:
             }
         )
     
-    def _upsert_files_chunk(self, run_id: int, entries: list[FileEntry]) -> None:
+    def _upsert_files_chunk(
+        self,
+        conn: sqlite3.Connection,
+        run_id: int,
+        entries: list[FileEntry]
+    ) -> None:
         """파일 청크 저장 (내부 메서드).
         
+        트랜잭션은 호출자가 관리한다.
+        
         Args:
+            conn: SQLite 커넥션.
             run_id: Run ID.
             entries: 파일 엔트리 리스트 (청크).
         """
-        conn = self._connect()
-        try:
-            # Upsert SQL: ON CONFLICT DO UPDATE
-            sql = """
-            INSERT INTO files (run_id, path, size, mtime, ext, is_hidden, is_symlink)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(run_id, path) DO UPDATE SET
-                size = excluded.size,
-                mtime = excluded.mtime,
-                ext = excluded.ext,
-                is_hidden = excluded.is_hidden,
-                is_symlink = excluded.is_symlink
-            """
-            
-            values = [
-                (
-                    run_id,
-                    entry.path.as_posix(),  # 절대 경로, POSIX 형식
-                    entry.size,
-                    entry.mtime.isoformat(),  # ISO format
-                    entry.extension,
-                    1 if entry.is_hidden else 0,  # INTEGER (0/1)
-                    1 if entry.is_symlink else 0,  # INTEGER (0/1)
-                )
-                for entry in entries
-            ]
-            
-            with conn:  # 트랜잭션
-                conn.executemany(sql, values)
-        finally:
-            conn.close()
+        values = [
+            (
+                run_id,
+                entry.path.as_posix(),  # 절대 경로, POSIX 형식
+                entry.size,
+                entry.mtime.isoformat(),  # ISO format
+                entry.extension,
+                1 if entry.is_hidden else 0,  # INTEGER (0/1)
+                1 if entry.is_symlink else 0,  # INTEGER (0/1)
+            )
+            for entry in entries
+        ]
+        
+        conn.executemany(UPSERT_FILES, values)
     
     def finalize_run(self, run_id: int, summary: RunSummary) -> None:
         """Run 완료 처리.
@@ -363,14 +374,7 @@ class SQLiteIndexRepository:
         conn = self._connect()
         try:
             cursor = conn.cursor()
-            cursor.execute(
-                """SELECT ext, COUNT(*) as count, SUM(size) as total_bytes
-                   FROM files
-                   WHERE run_id = ?
-                   GROUP BY ext
-                   ORDER BY count DESC""",
-                (run_id,)
-            )
+            cursor.execute(SELECT_EXT_DISTRIBUTION, (run_id,))
             rows = cursor.fetchall()
             result = [
                 ExtStat(ext=ext, count=count, total_bytes=total_bytes)
@@ -398,10 +402,15 @@ class SQLiteIndexRepository:
         ext: Optional[str] = None,
         min_size: Optional[int] = None,
         max_size: Optional[int] = None,
-        order_by: str = "path"
+        order_by: str = "path",
+        after_id: Optional[int] = None
     ) -> list[FileEntry]:
         """파일 목록 조회 (페이지네이션).
         
+        ``after_id``를 주면 키셋 페이지네이션으로 동작한다: ``file_id > after_id``인
+        파일을 ``file_id`` 오름차순으로 반환하며 ``offset``/``order_by``는 무시한다.
+        OFFSET과 달리 건너뛴 행을 스캔하지 않으므로 전체 순회 시 사용한다.
+        
         Args:
             run_id: Run ID.
             offset: 시작 오프셋 (기본값: 0).
@@ -410,6 +419,7 @@ class SQLiteIndexRepository:
             min_size: 최소 크기 필터 (선택적, 바이트).
             max_size: 최대 크기 필터 (선택적, 바이트).
             order_by: 정렬 기준 (기본값: "path", 허용: "path", "size_desc", "mtime_desc").
+            after_id: 이전 페이지의 마지막 file_id (선택적, 키셋 페이지네이션).
         
         Returns:
             파일 엔트리 리스트.
@@ -423,45 +433,16 @@ class SQLiteIndexRepository:
                 "limit": limit,
                 "ext": ext,
                 "order_by": order_by,
+                "after_id": after_id,
             }
         )
         
-        # order_by 화이트리스트 검증 (SQL injection 방지)
-        if order_by not in self.ALLOWED_ORDER_BY:
-            raise ValueError(f"Invalid order_by: {order_by}. Allowed: {list(self.ALLOWED_ORDER_BY.keys())}")
-        
-        order_by_sql = self.ALLOWED_ORDER_BY[order_by]
+        sql, params = self._build_list_files_query(
+            run_id, offset, limit, ext, min_size, max_size, order_by, after_id
+        )
         
         conn = self._connect()
         try:
-            # WHERE 조건 구축
-            conditions = ["run_id = ?"]
-            params = [run_id]
-            
-            if ext is not None:
-                conditions.append("ext = ?")
-                params.append(ext)
-            
-            if min_size is not None:
-                conditions.append("size >= ?")
-                params.append(min_size)
-            
-            if max_size is not None:
-                conditions.append("size <= ?")
-                params.append(max_size)
-            
-            where_clause = " AND ".join(conditions)
-            
-            sql = f"""
-            SELECT file_id, path, size, mtime, ext, is_hidden, is_symlink
-            FROM files
-            WHERE {where_clause}
-            ORDER BY {order_by_sql}
-            LIMIT ? OFFSET ?
-            """
-            
-            params.extend([limit, offset])
-            
             cursor = conn.cursor()
             cursor.execute(sql, params)
             rows = cursor.fetchall()
@@ -493,6 +474,67 @@ class SQLiteIndexRepository:
         finally:
             conn.close()
     
+    def _build_list_files_query(
+        self,
+        run_id: int,
+        offset: int = 0,
+        limit: int = 200,
+        ext: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        order_by: str = "path",
+        after_id: Optional[int] = None
+    ) -> tuple[str, list]:
+        """``list_files``가 실행할 SQL과 파라미터 생성.
+        
+        인자는 ``list_files``와 같다.
+        
+        Returns:
+            (SQL 문자열, 파라미터 리스트) 튜플.
+        
+        Raises:
+            ValueError: 허용되지 않은 ``order_by``.
+        """
+        # order_by 화이트리스트 검증 (SQL injection 방지)
+        if order_by not in self.ALLOWED_ORDER_BY:
+            raise ValueError(f"Invalid order_by: {order_by}. Allowed: {list(self.ALLOWED_ORDER_BY.keys())}")
+        
+        order_by_sql = self.ALLOWED_ORDER_BY[order_by]
+        
+        # WHERE 조건 구축
+        conditions = ["run_id = ?"]
+        params = [run_id]
+        
+        if ext is not None:
+            conditions.append("ext = ?")
+            params.append(ext)
+        
+        if min_size is not None:
+            conditions.append("size >= ?")
+            params.append(min_size)
+        
+        if max_size is not None:
+            conditions.append("size <= ?")
+            params.append(max_size)
+        
+        if after_id is not None:
+            # 키셋 페이지네이션: 인덱스 seek 후 limit개만 읽음
+            conditions.append("file_id > ?")
+            params.append(after_id)
+            order_by_sql = "file_id ASC"
+            page_clause = "LIMIT ?"
+            params.append(limit)
+        else:
+            page_clause = "LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        
+        sql = SELECT_FILES_TEMPLATE.format(
+            where_clause=" AND ".join(conditions),
+            order_by=order_by_sql,
+            page_clause=page_clause,
+        )
+        return sql, params
+    
     def close(self) -> None:
         """리소스 정리.
         
@@ -1,5 +1,6 @@
 """파일 시스템 스캐너."""
 import os
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional
@@ -11,6 +12,23 @@ from application.utils.debug_logger import debug_step
 from domain.entities.file_entry import FileEntry
 
 
+def _lower_suffix(name: str) -> str:
+    """파일명에서 소문자 확장자 추출 (``Path(name).suffix.lower()``와 동일).
+    
+    스캔 루프에서 파일마다 ``Path`` 객체를 만들지 않도록 문자열만으로 처리.
+    
+    Args:
+        name: 파일명 (경로 구분자 없음).
+    
+    Returns:
+        소문자 확장자 (예: ".txt"). 없으면 빈 문자열.
+    """
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[i:].lower()
+    return ""
+
+
 class FileSystemScanner:
     """파일 시스템 스캐너 - FileScanner Protocol 구현."""
     
@@ -88,13 +106,15 @@ class FileSystemScanner:
         )
         
         entries: list[FileEntry] = []
-        dirs_to_scan = [root_folder]
+        # 너비 우선 순회 (popleft O(1)), 하위 디렉토리는 문자열 경로로 보관
+        dirs_to_scan: deque[str] = deque([str(root_folder)])
         processed_files = 0
+        total_bytes = 0
         
         debug_step(self._log_sink, "directory_scan_start", {"root_path": str(root_folder)})
         
         while dirs_to_scan and not self._cancelled:
-            current_dir = dirs_to_scan.pop(0)
+            current_dir = dirs_to_scan.popleft()
             
             try:
                 with os.scandir(current_dir) as it:
@@ -106,44 +126,44 @@ class FileSystemScanner:
                         if entry.name.startswith('.') and not request.include_hidden:
                             continue
                         
-                        # 심볼릭 링크 처리
-                        if entry.is_symlink():
+                        # 심볼릭 링크 처리 (DirEntry 캐시 값이지만 한 번만 조회)
+                        is_symlink = entry.is_symlink()
+                        if is_symlink:
                             if not request.include_symlinks:
                                 continue
                             # TODO: 순환 링크 방지 (Phase 2에서 추가)
                         
                         if entry.is_file(follow_symlinks=False):
+                            # 확장자는 파일당 한 번만 계산 (확장자 없으면 빈 문자열)
+                            ext = _lower_suffix(entry.name)
+                            
                             # 확장자 필터
-                            if extensions is not None:
-                                ext = Path(entry.name).suffix.lower()
-                                if ext not in extensions:
-                                    continue
+                            if extensions is not None and ext not in extensions:
+                                continue
                             
                             try:
                                 stat = entry.stat(follow_symlinks=False)
-                                ext = Path(entry.name).suffix.lower()
-                                # 확장자 없으면 빈 문자열
                                 file_entry = FileEntry(
                                     path=Path(entry.path),
                                     size=stat.st_size,
                                     mtime=datetime.fromtimestamp(stat.st_mtime),
                                     extension=ext,  # 빈 문자열 가능
-                                    is_symlink=entry.is_symlink(),
+                                    is_symlink=is_symlink,
                                     is_hidden=entry.name.startswith('.'),
                                 )
                                 entries.append(file_entry)
                                 processed_files += 1
+                                total_bytes += stat.st_size
                                 
                                 # 진행률 콜백 및 로그 (매 100개 파일마다)
                                 if processed_files % 100 == 0:
-                                    total_bytes = sum(e.size for e in entries)
                                     debug_step(
                                         self._log_sink,
                                         "file_processed",
                                         {
                                             "count": processed_files,
                                             "total_bytes": total_bytes,
-                                            "current_dir": str(current_dir),
+                                            "current_dir": current_dir,
                                         }
                                     )
                                     if self._progress_callback:
@@ -156,7 +176,7 @@ class FileSystemScanner:
                                 continue
                         
                         elif entry.is_dir(follow_symlinks=False) and request.include_subdirs:
-                            dirs_to_scan.append(Path(entry.path))
+                            dirs_to_scan.append(entry.path)
             
             except (PermissionError, OSError) as e:
                 # 디렉토리 접근 오류는 무시하고 계속
@@ -164,14 +184,13 @@ class FileSystemScanner:
                     self._log_sink,
                     "directory_access_error",
                     {
-                        "path": str(current_dir),
+                        "path": current_dir,
                         "error": str(e),
                         "error_type": type(e).__name__,
                     }
                 )
                 continue
         
-        total_bytes = sum(e.size for e in entries)
         debug_step(
             self._log_sink,
             "scan_complete",
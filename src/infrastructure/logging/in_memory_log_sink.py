@@ -3,7 +3,7 @@ import json
 from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from PySide6.QtCore import QObject, Signal
 
@@ -86,6 +86,30 @@ class InMemoryLogSink(QObject):
         # 로그 파일에도 저장
         self._write_to_file(entry)
     
+    def write_batch(self, entries: Iterable[LogEntry]) -> None:
+        """로그 엔트리 일괄 기록.
+        
+        순환 버퍼에 한 번에 추가하고, 로그 파일은 날짜별로 한 번만 열어 기록한다.
+        
+        Args:
+            entries: 로그 엔트리들.
+        """
+        entries = list(entries)
+        now = None
+        for entry in entries:
+            # 타임스탬프가 없으면 현재 시간 사용
+            if not hasattr(entry, 'timestamp') or entry.timestamp is None:
+                if now is None:
+                    now = datetime.now()
+                entry.timestamp = now
+        
+        self._logs.extend(entries)
+        for entry in entries:
+            self.log_added.emit(entry)
+            self._print_to_console(entry)
+        
+        self._write_entries_to_file(entries)
+    
     def get_logs(
         self,
         job_id: Optional[int] = None,
@@ -163,40 +187,59 @@ class InMemoryLogSink(QObject):
         Args:
             entry: 로그 엔트리.
         """
+        self._write_entries_to_file([entry])
+    
+    def _write_entries_to_file(self, entries: list[LogEntry]) -> None:
+        """로그 파일에 저장 (같은 날짜 파일은 한 번만 열어 기록).
+        
+        Args:
+            entries: 로그 엔트리 리스트.
+        """
         try:
-            # 날짜별 로그 파일 (YYYY-MM-DD.log)
-            date_str = entry.timestamp.strftime("%Y-%m-%d")
-            
-            # 날짜가 바뀌었으면 새 파일 경로 설정
-            if self._current_date != date_str:
-                self._current_date = date_str
-                self._current_log_file = self._log_dir / f"{date_str}.log"
-            
-            # 로그 라인 포맷팅 (파일용 - 색상 코드 제외)
-            timestamp_str = entry.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # 밀리초 포함
-            level_str = entry.level
-            message_str = entry.message
-            
-            # Job ID가 있으면 표시
-            job_id_str = f" [Job:{entry.job_id}]" if entry.job_id is not None else ""
+            lines: list[str] = []
+            for entry in entries:
+                # 날짜별 로그 파일 (YYYY-MM-DD.log)
+                date_str = entry.timestamp.strftime("%Y-%m-%d")
+                
+                # 날짜가 바뀌었으면 모인 라인을 이전 파일에 쓰고 새 파일 경로 설정
+                if self._current_date != date_str:
+                    self._append_lines(lines)
+                    lines = []
+                    self._current_date = date_str
+                    self._current_log_file = self._log_dir / f"{date_str}.log"
+                
+                lines.append(self._format_file_line(entry))
             
-            # Context 정보가 있으면 표시
-            context_str = ""
-            if entry.context:
-                try:
-                    # Context를 JSON 형식으로 포맷팅 (한 줄로)
-                    context_json = json.dumps(entry.context, ensure_ascii=False, separators=(',', ':'))
-                    context_str = f" | {context_json}"
-                except (TypeError, ValueError):
-                    # JSON 변환 실패 시 문자열로 표시
-                    context_str = f" | {str(entry.context)}"
-            
-            log_line = f"[{timestamp_str}] [{level_str}]{job_id_str} {message_str}{context_str}\n"
-            
-            # 파일에 추가 (append 모드)
-            if self._current_log_file:
-                with open(self._current_log_file, 'a', encoding=Constants.LOG_FILE_ENCODING) as f:
-                    f.write(log_line)
+            self._append_lines(lines)
         except Exception as e:
             # 파일 쓰기 실패 시 콘솔에만 에러 출력 (무한 루프 방지)
             print(f"[ERROR] 로그 파일 쓰기 실패: {e}")
+    
+    def _append_lines(self, lines: list[str]) -> None:
+        """현재 로그 파일에 라인 추가 (append 모드)."""
+        if lines and self._current_log_file:
+            with open(self._current_log_file, 'a', encoding=Constants.LOG_FILE_ENCODING) as f:
+                f.write("".join(lines))
+    
+    @staticmethod
+    def _format_file_line(entry: LogEntry) -> str:
+        """로그 라인 포맷팅 (파일용 - 색상 코드 제외)."""
+        timestamp_str = entry.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # 밀리초 포함
+        level_str = entry.level
+        message_str = entry.message
+        
+        # Job ID가 있으면 표시
+        job_id_str = f" [Job:{entry.job_id}]" if entry.job_id is not None else ""
+        
+        # Context 정보가 있으면 표시
+        context_str = ""
+        if entry.context:
+            try:
+                # Context를 JSON 형식으로 포맷팅 (한 줄로)
+                context_json = json.dumps(entry.context, ensure_ascii=False, separators=(',', ':'))
+                context_str = f" | {context_json}"
+            except (TypeError, ValueError):
+                # JSON 변환 실패 시 문자열로 표시
+                context_str = f" | {str(entry.context)}"
+        
+        return f"[{timestamp_str}] [{level_str}]{job_id_str} {message_str}{context_str}\n"
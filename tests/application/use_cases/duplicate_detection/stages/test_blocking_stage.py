@@ -94,3 +94,27 @@ def test_blocking_stage_execute_no_files():
     result_context = stage.execute(context)
     
     assert result_context.blocking_groups == []
+
+
+def test_blocking_stage_execute_single_file():
+    """파일이 1개인 경우 그룹이 생성되지 않는지 테스트."""
+    filename_parser = FilenameParser()
+    blocking_service = BlockingService(filename_parser=filename_parser)
+    
+    stage = BlockingStage(blocking_service=blocking_service)
+    
+    file_entry = FileEntry(
+        path=Path("test 1-10.txt"),
+        size=100,
+        mtime=datetime.now(),
+        extension=".txt",
+        file_id=1
+    )
+    
+    request = DuplicateDetectionRequest(run_id=1)
+    context = PipelineContext(request=request)
+    context.file_parse_pairs = [(file_entry, filename_parser.parse(file_entry.path))]
+    
+    result_context = stage.execute(context)
+    
+    assert result_context.blocking_groups == []
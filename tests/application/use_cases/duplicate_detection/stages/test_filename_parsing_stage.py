@@ -1,7 +1,7 @@
 """FilenameParsingStage 테스트."""
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -188,8 +188,6 @@ def test_filename_parsing_stage_execute_no_file_id():
 
 def test_filename_parsing_stage_execute_parsing_error():
     """파싱 오류 발생 시 테스트 (잘못된 범위 등)."""
-    from unittest.mock import Mock, patch
-    
     filename_parser = FilenameParser()
     index_repository = Mock(spec=IIndexRepository)
     log_sink = Mock(spec=ILogSink)
@@ -219,9 +217,7 @@ def test_filename_parsing_stage_execute_parsing_error():
     # 첫 번째 파일은 정상 파싱, 두 번째 파일은 파싱 오류 발생
     def mock_parse(path: Path) -> FilenameParseResult:
         if path == file_entry2.path:
-            # 잘못된 범위로 인한 검증 오류 시뮬레이션
-            from domain.value_objects.range_segment import RangeSegment
-            # start > end인 경우 ValueError 발생
+            # 잘못된 범위로 인한 검증 오류 시뮬레이션 (start > end인 경우 ValueError 발생)
             raise ValueError("start (275) must be <= end (99)")
         # 정상 파싱
         return FilenameParseResult(
@@ -1,9 +1,24 @@
 """Pytest 설정 파일."""
 
+import os
 import sys
 from pathlib import Path
 
+# 테스트 실행 중 __pycache__/.pyc 쓰기 생략 (xdist 워커 등 하위 프로세스에도 전달)
+os.environ.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+sys.dont_write_bytecode = True
+
 # src 디렉토리를 sys.path에 추가
 src_path = Path(__file__).parent.parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
+
+
+def pytest_configure(config):
+    """pytest-xdist 병렬 실행 시 모듈 단위 분배(loadfile)를 기본으로 사용.
+
+    모듈/세션 스코프 fixture(공유 서비스, 캐시된 테스트 데이터)가 워커마다
+    중복 생성되지 않도록 ``-n auto``만 지정해도 ``--dist=loadfile``로 동작한다.
+    """
+    if config.pluginmanager.hasplugin("xdist") and getattr(config.option, "dist", "no") == "load":
+        config.option.dist = "loadfile"
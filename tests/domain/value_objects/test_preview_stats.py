@@ -1,5 +1,9 @@
 """PreviewStats ValueObject 테스트."""
 
+import copy
+import pickle
+from dataclasses import asdict
+
 import pytest
 
 from domain.value_objects.preview_stats import PreviewStats
@@ -43,30 +47,24 @@ class TestPreviewStatsCreation:
 class TestPreviewStatsValidation:
     """PreviewStats 검증 테스트."""
     
-    def test_invalid_negative_files(self):
-        """파일 수가 음수이면 실패."""
-        with pytest.raises(ValueError, match="estimated_total_files must be >= 0"):
-            PreviewStats(
-                estimated_total_files=-1,
-                top_extensions={}
-            )
-    
-    def test_invalid_negative_bytes(self):
-        """크기가 음수이면 실패."""
-        with pytest.raises(ValueError, match="estimated_bytes must be >= 0"):
-            PreviewStats(
-                estimated_total_files=100,
-                top_extensions={".txt": 70},
-                estimated_bytes=-1
-            )
-    
-    def test_invalid_negative_extension_count(self):
-        """확장자 파일 수가 음수이면 실패."""
-        with pytest.raises(ValueError, match="Extension count .* must be >= 0"):
-            PreviewStats(
-                estimated_total_files=100,
-                top_extensions={".txt": -10}
-            )
+    @pytest.mark.parametrize("kwargs,match", [
+        (
+            {"estimated_total_files": -1, "top_extensions": {}},
+            "estimated_total_files must be >= 0",
+        ),
+        (
+            {"estimated_total_files": 100, "top_extensions": {".txt": 70}, "estimated_bytes": -1},
+            "estimated_bytes must be >= 0",
+        ),
+        (
+            {"estimated_total_files": 100, "top_extensions": {".txt": -10}},
+            "Extension count .* must be >= 0",
+        ),
+    ], ids=["negative_files", "negative_bytes", "negative_extension_count"])
+    def test_invalid_values(self, kwargs, match):
+        """파일 수/크기/확장자 파일 수가 음수이면 실패."""
+        with pytest.raises(ValueError, match=match):
+            PreviewStats(**kwargs)
 
 
 class TestPreviewStatsImmutability:
@@ -81,6 +79,72 @@ class TestPreviewStatsImmutability:
         
         with pytest.raises(Exception):  # FrozenInstanceError
             stats.estimated_total_files = 200  # type: ignore
+    
+    def test_top_extensions_copied(self):
+        """입력 dict를 바꿔도 통계와 파생 값은 그대로."""
+        extensions = {".txt": 70, ".md": 30}
+        stats = PreviewStats(
+            estimated_total_files=100,
+            top_extensions=extensions
+        )
+        
+        extensions[".pdf"] = 90
+        
+        assert stats.top_extensions == {".txt": 70, ".md": 30}
+        assert stats.extension_count == 2
+        assert stats.get_most_common_extension() == ".txt"
+    
+    @pytest.mark.parametrize("copy_fn", [
+        lambda stats: pickle.loads(pickle.dumps(stats)),
+        copy.copy,
+        copy.deepcopy,
+    ], ids=["pickle", "copy", "deepcopy"])
+    def test_copy_roundtrip(self, copy_fn):
+        """pickle/copy 후에도 값, 파생 값, 해시가 같다."""
+        stats = PreviewStats(
+            estimated_total_files=100,
+            top_extensions={".txt": 70, ".md": 30},
+            estimated_bytes=2048
+        )
+        hash(stats)  # 캐시된 해시가 있는 상태에서 복사
+        
+        copied = copy_fn(stats)
+        
+        assert copied == stats
+        assert hash(copied) == hash(stats)
+        assert copied.top_extensions == {".txt": 70, ".md": 30}
+        assert copied.get_top_extensions(1) == [(".txt", 70)]
+        assert copied.extension_count == 2
+    
+    def test_asdict(self):
+        """asdict로 생성 인자를 그대로 꺼낼 수 있다."""
+        stats = PreviewStats(
+            estimated_total_files=100,
+            top_extensions={".txt": 70},
+            estimated_bytes=2048
+        )
+        
+        result = asdict(stats)
+        
+        assert result["estimated_total_files"] == 100
+        assert result["top_extensions"] == {".txt": 70}
+        assert type(result["top_extensions"]) is dict
+        assert result["estimated_bytes"] == 2048
+    
+    def test_hashable(self):
+        """동등한 통계는 확장자 순서와 무관하게 같은 해시."""
+        stats_a = PreviewStats(
+            estimated_total_files=100,
+            top_extensions={".txt": 50, ".md": 50}
+        )
+        stats_b = PreviewStats(
+            estimated_total_files=100,
+            top_extensions={".md": 50, ".txt": 50}
+        )
+        
+        assert hash(stats_a) == hash(stats_b)
+        assert hash(stats_a) == hash(stats_a)  # 캐시된 값 재사용
+        assert len({stats_a, stats_b}) == 1
 
 
 class TestPreviewStatsProperties:
@@ -154,33 +218,20 @@ class TestPreviewStatsMethods:
         
         assert stats.get_most_common_extension() is None
     
-    def test_get_extension_percentage(self):
+    @pytest.mark.parametrize("total,extensions,extension,expected", [
+        (100, {".txt": 70, ".md": 30}, ".txt", 70.0),
+        (100, {".txt": 70, ".md": 30}, ".md", 30.0),
+        (100, {".txt": 70}, ".pdf", 0.0),  # 없는 확장자
+        (0, {}, ".txt", 0.0),  # 빈 통계
+    ], ids=["txt", "md", "not_exist", "empty_stats"])
+    def test_get_extension_percentage(self, total, extensions, extension, expected):
         """확장자 비율 계산."""
         stats = PreviewStats(
-            estimated_total_files=100,
-            top_extensions={".txt": 70, ".md": 30}
-        )
-        
-        assert stats.get_extension_percentage(".txt") == 70.0
-        assert stats.get_extension_percentage(".md") == 30.0
-    
-    def test_get_extension_percentage_not_exist(self):
-        """없는 확장자는 0.0."""
-        stats = PreviewStats(
-            estimated_total_files=100,
-            top_extensions={".txt": 70}
-        )
-        
-        assert stats.get_extension_percentage(".pdf") == 0.0
-    
-    def test_get_extension_percentage_empty_stats(self):
-        """빈 통계에서 비율은 0.0."""
-        stats = PreviewStats(
-            estimated_total_files=0,
-            top_extensions={}
+            estimated_total_files=total,
+            top_extensions=extensions
         )
         
-        assert stats.get_extension_percentage(".txt") == 0.0
+        assert stats.get_extension_percentage(extension) == expected
     
     def test_has_extension_true(self):
         """확장자 존재 확인 (있음)."""
@@ -22,14 +22,23 @@ def write_file(path: Path, content: str, encoding: str = "utf-8") -> None:
     path.write_text(content, encoding=encoding)
 
 
+# 고정 내용은 모듈 로드 시 한 번만 인코딩 (결정적)
+# 대용량 파일 내용
+_LARGE_CONTENT_BYTES = ("대용량 파일 테스트\n" * 1000).encode("utf-8")
+# 완전 중복 파일 3개가 공유하는 내용
+_EXACT_DUP_CONTENT_BYTES = "소설 제목\n작가명\n\n1화\n내용입니다.\n".encode("utf-8")
+# 제목만 다른 파일 2개가 공유하는 본문
+_TITLE_VARIANT_BODY_BYTES = "1화\n본문 내용입니다.\n".encode("utf-8")
+
+
 def create_exact_duplicates(base_path: Path) -> None:
     """완전 동일 파일 중복 생성 (소규모 데이터셋)."""
     small_dir = base_path / "small"
+    small_dir.mkdir(parents=True, exist_ok=True)
     
-    # 동일한 내용의 파일 3개 (완전 중복)
-    content = "소설 제목\n작가명\n\n1화\n내용입니다.\n"
+    # 동일한 내용의 파일 3개 (완전 중복) - 미리 인코딩한 같은 바이트를 기록
     for i in range(1, 4):
-        write_file(small_dir / f"novel_exact_dup_{i}.txt", content)
+        (small_dir / f"novel_exact_dup_{i}.txt").write_bytes(_EXACT_DUP_CONTENT_BYTES)
     
     # 다른 내용의 파일 2개
     write_file(small_dir / "novel_unique_1.txt", "다른 소설\n내용 A\n")
@@ -55,36 +64,38 @@ def create_medium_dataset(base_path: Path) -> None:
     medium_dir = base_path / "medium"
     
     # 여러 중복 그룹 생성
+    pairs: list[tuple[Path, bytes]] = []
     for group_id in range(1, 11):  # 10개의 중복 그룹
-        content = f"소설 그룹 {group_id}\n작가 {group_id}\n\n내용 그룹 {group_id}\n"
+        # 그룹 내 5개 파일이 같은 바이트를 공유하도록 그룹당 한 번만 인코딩
+        content = f"소설 그룹 {group_id}\n작가 {group_id}\n\n내용 그룹 {group_id}\n".encode("utf-8")
         for file_num in range(1, 6):  # 각 그룹당 5개 파일
-            write_file(
-                medium_dir / f"group_{group_id}_file_{file_num}.txt",
-                content
-            )
+            pairs.append((medium_dir / f"group_{group_id}_file_{file_num}.txt", content))
     
     # 고유 파일들
     for i in range(1, 51):  # 50개의 고유 파일
-        write_file(
-            medium_dir / f"unique_{i}.txt",
-            f"고유 소설 {i}\n내용 {i}\n"
-        )
+        pairs.append((medium_dir / f"unique_{i}.txt", f"고유 소설 {i}\n내용 {i}\n".encode("utf-8")))
+    
+    # 디렉토리는 한 번만 만들고 파일을 순서대로 작성
+    medium_dir.mkdir(parents=True, exist_ok=True)
+    for path, content in pairs:
+        path.write_bytes(content)
 
 
 def create_edge_cases(base_path: Path) -> None:
     """엣지 케이스 데이터셋 생성."""
     edge_dir = base_path / "edge_cases"
+    edge_dir.mkdir(parents=True, exist_ok=True)
     
     # 1. 제목이 다르지만 내용 동일
-    content = "1화\n본문 내용입니다.\n"
-    write_file(edge_dir / "novel_title_A.txt", f"소설 A\n{content}")
-    write_file(edge_dir / "novel_title_B.txt", f"소설 B\n{content}")
+    (edge_dir / "novel_title_A.txt").write_bytes("소설 A\n".encode("utf-8") + _TITLE_VARIANT_BODY_BYTES)
+    (edge_dir / "novel_title_B.txt").write_bytes("소설 B\n".encode("utf-8") + _TITLE_VARIANT_BODY_BYTES)
     
     # 2. 포함 관계 (1-114화 vs 1-158화)
-    part1_114 = "\n".join([f"{i}화 내용" for i in range(1, 115)])
-    part1_158 = "\n".join([f"{i}화 내용" for i in range(1, 159)])
-    write_file(edge_dir / "novel_1-114.txt", f"소설 제목\n{part1_114}")
-    write_file(edge_dir / "novel_1-158.txt", f"소설 제목\n{part1_158}")
+    # 회차 줄은 한 번만 인코딩하고, 1-114화는 그 앞부분 줄로 만든다
+    header = "소설 제목\n".encode("utf-8")
+    encoded_lines = [f"{i}화 내용".encode("utf-8") for i in range(1, 159)]
+    (edge_dir / "novel_1-114.txt").write_bytes(header + b"\n".join(encoded_lines[:114]))
+    (edge_dir / "novel_1-158.txt").write_bytes(header + b"\n".join(encoded_lines))
     
     # 3. 인코딩이 섞인 텍스트
     utf8_content = "UTF-8 파일\n한글 내용입니다.\n"
@@ -108,8 +119,8 @@ def create_edge_cases(base_path: Path) -> None:
     
     # 6. 매우 큰 파일 (대용량 테스트용, 실제로는 작은 크기로 생성)
     # 실제 대용량 파일은 생성하지 않고, 참고용으로만
-    large_content = "대용량 파일 테스트\n" * 1000  # 실제로는 작게
-    write_file(edge_dir / "large_file.txt", large_content)
+    # 텍스트 코덱 경로를 거치지 않도록 미리 인코딩한 바이트를 그대로 기록
+    (edge_dir / "large_file.txt").write_bytes(_LARGE_CONTENT_BYTES)
     
     # 7. 바이너리 파일 (텍스트가 아닌 파일)
     binary_file = edge_dir / "binary.bin"
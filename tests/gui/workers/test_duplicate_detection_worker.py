@@ -1,21 +1,38 @@
 """DuplicateDetectionWorker 테스트."""
 from pathlib import Path
-from unittest.mock import Mock
 
 import pytest
 
 from application.dto.duplicate_detection_request import DuplicateDetectionRequest
-from application.ports.index_repository import IIndexRepository
-from application.ports.log_sink import ILogSink
+from application.dto.log_entry import LogEntry
 from application.use_cases.duplicate_detection.stages.base_stage import PipelineError
 from gui.workers.duplicate_detection_worker import DuplicateDetectionWorker
 
 
+class _FakeIndexRepo:
+    """IIndexRepository 대역 (Worker 생성 시 메서드 호출 없음)."""
+
+
+class _FakeLogSink:
+    """ILogSink 대역 (기록된 엔트리만 보관)."""
+    
+    def __init__(self) -> None:
+        self.entries: list[LogEntry] = []
+    
+    def write(self, entry: LogEntry) -> None:
+        self.entries.append(entry)
+
+
+def _raise_pipeline_error(*_args, **_kwargs):
+    """Pipeline.execute 대역 (항상 PipelineError 발생)."""
+    raise PipelineError("Test error")
+
+
 def test_worker_initialization():
     """Worker 초기화 테스트."""
     request = DuplicateDetectionRequest(run_id=1)
-    index_repository = Mock(spec=IIndexRepository)
-    log_sink = Mock(spec=ILogSink)
+    index_repository = _FakeIndexRepo()
+    log_sink = _FakeLogSink()
     
     worker = DuplicateDetectionWorker(
         request=request,
@@ -33,8 +50,8 @@ def test_worker_initialization():
 def test_worker_cancel():
     """Worker 취소 테스트."""
     request = DuplicateDetectionRequest(run_id=1)
-    index_repository = Mock(spec=IIndexRepository)
-    log_sink = Mock(spec=ILogSink)
+    index_repository = _FakeIndexRepo()
+    log_sink = _FakeLogSink()
     
     worker = DuplicateDetectionWorker(
         request=request,
@@ -50,7 +67,7 @@ def test_worker_cancel():
 def test_worker_run_no_index_repository():
     """IndexRepository가 없는 경우 테스트."""
     request = DuplicateDetectionRequest(run_id=1)
-    log_sink = Mock(spec=ILogSink)
+    log_sink = _FakeLogSink()
     
     worker = DuplicateDetectionWorker(
         request=request,
@@ -73,19 +90,18 @@ def test_worker_run_no_index_repository():
 def test_worker_run_pipeline_error():
     """Pipeline 에러 발생 시 테스트."""
     request = DuplicateDetectionRequest(run_id=1)
-    index_repository = Mock(spec=IIndexRepository)
-    log_sink = Mock(spec=ILogSink)
+    index_repository = _FakeIndexRepo()
+    log_sink = _FakeLogSink()
     
-    # Mock Pipeline 설정
     worker = DuplicateDetectionWorker(
         request=request,
         index_repository=index_repository,
         log_sink=log_sink
     )
     
-    # Pipeline의 execute를 Mock하여 에러 발생시키기
+    # Pipeline의 execute를 교체하여 에러 발생시키기
     if worker._pipeline:
-        worker._pipeline.execute = Mock(side_effect=PipelineError("Test error"))
+        worker._pipeline.execute = _raise_pipeline_error
     
     error_emitted = []
     
@@ -1,31 +1,64 @@
 """SQLiteIndexRepository 테스트."""
-import sys
-import tempfile
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-# 프로젝트 루트를 sys.path에 추가
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
-
 from application.dto.run_summary import RunSummary
 from application.dto.scan_request import ScanRequest
 from application.dto.ext_stat import ExtStat
 from domain.entities.file_entry import FileEntry
+from infrastructure.db.schema import SELECT_EXT_DISTRIBUTION
 from infrastructure.db.sqlite_index_repository import SQLiteIndexRepository
 
 
+def _names(entries: list[FileEntry]) -> frozenset[str]:
+    """FileEntry 리스트의 파일명 집합."""
+    return frozenset(entry.path.name for entry in entries)
+
+
+@pytest.fixture(scope="session")
+def template_db(tmp_path_factory) -> sqlite3.Connection:
+    """스키마가 적용된 인메모리 템플릿 DB (세션당 한 번 생성).
+    
+    DDL은 저장소의 ``_ensure_schema``를 그대로 사용하도록 저장소로 한 번 생성한 뒤
+    메모리로 복사해 둔다.
+    """
+    seed_path = tmp_path_factory.mktemp("index_template") / "template.db"
+    SQLiteIndexRepository(db_path=seed_path)
+    
+    source = sqlite3.connect(str(seed_path))
+    template = sqlite3.connect(":memory:")
+    try:
+        source.backup(template)
+    finally:
+        source.close()
+    
+    yield template
+    template.close()
+
+
+@pytest.fixture(scope="session")
+def session_db_path(tmp_path_factory) -> Path:
+    """세션 공용 DB 파일 경로 (세션당 파일 하나)."""
+    return tmp_path_factory.mktemp("index_db") / "index.db"
+
+
 @pytest.fixture
-def temp_db() -> Path:
-    """임시 DB 파일 경로 생성."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-        db_path = Path(f.name)
-    yield db_path
-    # 테스트 후 정리
-    if db_path.exists():
-        db_path.unlink()
+def temp_db(template_db: sqlite3.Connection, session_db_path: Path) -> Path:
+    """템플릿 DB로 초기화된 세션 공용 DB 파일 경로.
+    
+    ``backup()``은 대상 DB를 통째로 덮어쓰므로 이전 테스트의 데이터가 남지 않는다.
+    저장소가 메서드 호출마다 새 커넥션을 열기 때문에 SAVEPOINT 롤백 대신 이 방식으로 격리한다.
+    """
+    dest = sqlite3.connect(str(session_db_path))
+    try:
+        template_db.backup(dest)
+    finally:
+        dest.close()
+    
+    return session_db_path
 
 
 @pytest.fixture
@@ -34,7 +67,7 @@ def repository(temp_db: Path) -> SQLiteIndexRepository:
     return SQLiteIndexRepository(db_path=temp_db)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scan_request() -> ScanRequest:
     """테스트용 ScanRequest 생성."""
     return ScanRequest(
@@ -47,7 +80,7 @@ def scan_request() -> ScanRequest:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def file_entries() -> list[FileEntry]:
     """테스트용 FileEntry 리스트 생성."""
     base_time = datetime.now()
@@ -87,6 +120,56 @@ def file_entries() -> list[FileEntry]:
     ]
 
 
+@pytest.fixture(scope="session")
+def populated_template(
+    template_db: sqlite3.Connection,
+    tmp_path_factory,
+    scan_request: ScanRequest,
+    file_entries: list[FileEntry]
+) -> tuple[sqlite3.Connection, int]:
+    """``file_entries``가 한 번 저장된 인메모리 템플릿 DB와 run_id (세션당 한 번 생성)."""
+    seed_path = tmp_path_factory.mktemp("index_populated") / "populated.db"
+    seed = sqlite3.connect(str(seed_path))
+    try:
+        template_db.backup(seed)
+    finally:
+        seed.close()
+    
+    seed_repository = SQLiteIndexRepository(db_path=seed_path)
+    run_id = seed_repository.start_run(scan_request)
+    seed_repository.upsert_files(run_id, file_entries)
+    
+    source = sqlite3.connect(str(seed_path))
+    populated = sqlite3.connect(":memory:")
+    try:
+        source.backup(populated)
+    finally:
+        source.close()
+    
+    yield populated, run_id
+    populated.close()
+
+
+@pytest.fixture
+def populated_run(
+    repository: SQLiteIndexRepository,
+    populated_template: tuple[sqlite3.Connection, int],
+    session_db_path: Path
+) -> int:
+    """읽기 전용 테스트용 run_id (저장된 파일을 템플릿에서 복사, 재삽입 없음).
+    
+    ``repository``가 DB를 초기화한 뒤 덮어쓰도록 ``repository``에 의존한다.
+    """
+    populated, run_id = populated_template
+    dest = sqlite3.connect(str(session_db_path))
+    try:
+        populated.backup(dest)
+    finally:
+        dest.close()
+    
+    return run_id
+
+
 def test_start_run(repository: SQLiteIndexRepository, scan_request: ScanRequest) -> None:
     """start_run 테스트."""
     run_id = repository.start_run(scan_request)
@@ -111,12 +194,13 @@ def test_upsert_files(repository: SQLiteIndexRepository, scan_request: ScanReque
     # 파일이 저장되었는지 확인
     files = repository.list_files(run_id)
     assert len(files) == len(file_entries)
+    assert _names(files) == _names(file_entries)
     
     # 첫 번째 파일 확인
-    file1 = next((f for f in files if f.path.name == "file1.txt"), None)
-    assert file1 is not None
-    assert file1.size == 100
-    assert file1.extension == ".txt"
+    by_name = {f.path.name: f for f in files}
+    assert "file1.txt" in by_name
+    assert by_name["file1.txt"].size == 100
+    assert by_name["file1.txt"].extension == ".txt"
 
 
 def test_upsert_files_duplicate_path(repository: SQLiteIndexRepository, scan_request: ScanRequest, file_entries: list[FileEntry]) -> None:
@@ -142,9 +226,9 @@ def test_upsert_files_duplicate_path(repository: SQLiteIndexRepository, scan_req
     assert len(files) == len(file_entries)
     
     # 크기가 업데이트되었는지 확인
-    file1 = next((f for f in files if f.path.name == "file1.txt"), None)
-    assert file1 is not None
-    assert file1.size == 999
+    by_name = {f.path.name: f for f in files}
+    assert "file1.txt" in by_name
+    assert by_name["file1.txt"].size == 999
 
 
 def test_finalize_run(repository: SQLiteIndexRepository, scan_request: ScanRequest) -> None:
@@ -205,17 +289,17 @@ def test_get_run_summary(repository: SQLiteIndexRepository, scan_request: ScanRe
     assert repository.get_run_summary(99999) is None
 
 
-def test_get_ext_distribution(repository: SQLiteIndexRepository, scan_request: ScanRequest, file_entries: list[FileEntry]) -> None:
+def test_get_ext_distribution(repository: SQLiteIndexRepository, populated_run: int) -> None:
     """get_ext_distribution 테스트."""
-    run_id = repository.start_run(scan_request)
-    repository.upsert_files(run_id, file_entries)
+    run_id = populated_run
     
     distribution = repository.get_ext_distribution(run_id)
     
     # .txt: 3개 (file1, file2, .hidden)
     # .md: 1개 (file3)
-    txt_stat = next((s for s in distribution if s.ext == ".txt"), None)
-    md_stat = next((s for s in distribution if s.ext == ".md"), None)
+    by_ext = {s.ext: s for s in distribution}
+    txt_stat = by_ext.get(".txt")
+    md_stat = by_ext.get(".md")
     
     assert txt_stat is not None
     assert txt_stat.count == 3
@@ -226,10 +310,9 @@ def test_get_ext_distribution(repository: SQLiteIndexRepository, scan_request: S
     assert md_stat.total_bytes == 300
 
 
-def test_list_files(repository: SQLiteIndexRepository, scan_request: ScanRequest, file_entries: list[FileEntry]) -> None:
+def test_list_files(repository: SQLiteIndexRepository, populated_run: int, file_entries: list[FileEntry]) -> None:
     """list_files 기본 테스트."""
-    run_id = repository.start_run(scan_request)
-    repository.upsert_files(run_id, file_entries)
+    run_id = populated_run
     
     files = repository.list_files(run_id)
     
@@ -237,10 +320,9 @@ def test_list_files(repository: SQLiteIndexRepository, scan_request: ScanRequest
     assert all(isinstance(f, FileEntry) for f in files)
 
 
-def test_list_files_pagination(repository: SQLiteIndexRepository, scan_request: ScanRequest, file_entries: list[FileEntry]) -> None:
+def test_list_files_pagination(repository: SQLiteIndexRepository, populated_run: int) -> None:
     """list_files 페이지네이션 테스트."""
-    run_id = repository.start_run(scan_request)
-    repository.upsert_files(run_id, file_entries)
+    run_id = populated_run
     
     # 첫 페이지 (limit=2)
     page1 = repository.list_files(run_id, offset=0, limit=2)
@@ -255,32 +337,43 @@ def test_list_files_pagination(repository: SQLiteIndexRepository, scan_request:
     assert len(page3) == 0
 
 
-def test_list_files_with_filters(repository: SQLiteIndexRepository, scan_request: ScanRequest, file_entries: list[FileEntry]) -> None:
-    """list_files 필터 테스트."""
-    run_id = repository.start_run(scan_request)
-    repository.upsert_files(run_id, file_entries)
+def test_list_files_keyset_pagination(repository: SQLiteIndexRepository, populated_run: int, file_entries: list[FileEntry]) -> None:
+    """list_files 키셋 페이지네이션 테스트 (after_id)."""
+    run_id = populated_run
     
-    # 확장자 필터
-    txt_files = repository.list_files(run_id, ext=".txt")
-    assert len(txt_files) == 3  # file1, file2, .hidden
-    assert all(f.extension == ".txt" for f in txt_files)
+    page1 = repository.list_files(run_id, after_id=0, limit=2)
+    page2 = repository.list_files(run_id, after_id=page1[-1].file_id, limit=2)
+    page3 = repository.list_files(run_id, after_id=page2[-1].file_id, limit=2)
     
-    # 크기 필터
-    large_files = repository.list_files(run_id, min_size=200)
-    assert len(large_files) == 2  # file2 (200), file3 (300)
+    assert len(page1) == 2
+    assert len(page2) == 2
+    assert page3 == []
     
-    small_files = repository.list_files(run_id, max_size=100)
-    assert len(small_files) == 2  # file1 (100), .hidden (50)
+    # file_id 오름차순, 페이지 간 중복 없음
+    file_ids = [f.file_id for f in page1 + page2]
+    assert file_ids == sorted(file_ids)
+    assert len(set(file_ids)) == len(file_entries)
+    assert _names(page1 + page2) == _names(file_entries)
+
+
+@pytest.mark.parametrize("filters,expected_count", [
+    ({"ext": ".txt"}, 3),  # file1, file2, .hidden
+    ({"min_size": 200}, 2),  # file2 (200), file3 (300)
+    ({"max_size": 100}, 2),  # file1 (100), .hidden (50)
+    ({"ext": ".txt", "min_size": 100}, 2),  # file1, file2 (100 이상)
+], ids=["ext", "min_size", "max_size", "ext_and_min_size"])
+def test_list_files_with_filters(repository: SQLiteIndexRepository, populated_run: int, filters: dict, expected_count: int) -> None:
+    """list_files 필터 테스트."""
+    files = repository.list_files(populated_run, **filters)
     
-    # 복합 필터
-    filtered = repository.list_files(run_id, ext=".txt", min_size=100)
-    assert len(filtered) == 2  # file1, file2 (100 이상)
+    assert len(files) == expected_count
+    if "ext" in filters:
+        assert all(f.extension == filters["ext"] for f in files)
 
 
-def test_list_files_order_by(repository: SQLiteIndexRepository, scan_request: ScanRequest, file_entries: list[FileEntry]) -> None:
+def test_list_files_order_by(repository: SQLiteIndexRepository, populated_run: int) -> None:
     """list_files 정렬 테스트."""
-    run_id = repository.start_run(scan_request)
-    repository.upsert_files(run_id, file_entries)
+    run_id = populated_run
     
     # 크기 내림차순
     files_by_size = repository.list_files(run_id, order_by="size_desc")
@@ -293,6 +386,32 @@ def test_list_files_order_by(repository: SQLiteIndexRepository, scan_request: Sc
         repository.list_files(run_id, order_by="invalid")
 
 
+@pytest.mark.parametrize("build_query,index_name", [
+    (lambda repo: (SELECT_EXT_DISTRIBUTION, (1,)), "idx_files_run_ext"),
+    (lambda repo: repo._build_list_files_query(1, min_size=100), "idx_files_run_size"),
+    (lambda repo: repo._build_list_files_query(1, after_id=0), "idx_files_run_file_id"),
+], ids=["ext_distribution", "size_filter", "keyset_page"])
+def test_query_plan_uses_composite_index(repository: SQLiteIndexRepository, temp_db: Path, build_query, index_name: str) -> None:
+    """저장소가 실행하는 조회 쿼리가 (run_id, ...) 복합 인덱스를 사용하는지 확인."""
+    sql, params = build_query(repository)
+    conn = sqlite3.connect(str(temp_db))
+    try:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    finally:
+        conn.close()
+    
+    assert any(f"INDEX {index_name}" in row[-1] for row in plan), plan
+
+
+def test_wal_enabled(repository: SQLiteIndexRepository, temp_db: Path) -> None:
+    """WAL 저널 모드가 활성화되어 있는지 확인."""
+    conn = sqlite3.connect(str(temp_db))
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+
 def test_close(repository: SQLiteIndexRepository) -> None:
     """close 테스트 (리소스 정리)."""
     # close는 아무 동작도 하지 않지만 호출 시 에러가 없어야 함
@@ -0,0 +1,61 @@
+"""InMemoryLogSink 테스트."""
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from app.settings.constants import Constants
+from application.dto.log_entry import LogEntry
+from infrastructure.logging.in_memory_log_sink import InMemoryLogSink
+
+
+def _entry(message: str, timestamp: datetime, **kwargs) -> LogEntry:
+    """테스트용 INFO 로그 엔트리."""
+    return LogEntry(timestamp=timestamp, level="INFO", message=message, **kwargs)
+
+
+def test_write_batch_appends_in_order(tmp_path):
+    """일괄 기록은 단건 기록 뒤에 입력 순서대로 추가된다."""
+    sink = InMemoryLogSink(log_dir=tmp_path)
+    
+    sink.write(_entry("a", datetime(2025, 1, 1, 9)))
+    sink.write_batch([
+        _entry("b", datetime(2025, 1, 1, 10)),
+        _entry("c", datetime(2025, 1, 1, 11)),
+    ])
+    
+    assert [log.message for log in sink.get_logs()] == ["a", "b", "c"]
+
+
+def test_write_batch_evicts_oldest_beyond_maxlen(tmp_path, monkeypatch):
+    """순환 버퍼 크기를 넘으면 가장 오래된 엔트리부터 버린다."""
+    monkeypatch.setattr(Constants, "MAX_LOG_ENTRIES", 3)
+    sink = InMemoryLogSink(log_dir=tmp_path)
+    
+    sink.write(_entry("a", datetime(2025, 1, 1, 9)))
+    sink.write_batch([
+        _entry(message, datetime(2025, 1, 1, 10))
+        for message in ("b", "c", "d")
+    ])
+    
+    assert [log.message for log in sink.get_logs()] == ["b", "c", "d"]
+
+
+def test_write_batch_writes_lines_to_dated_files(tmp_path):
+    """일괄 기록은 날짜별 로그 파일에 순서대로 라인을 추가한다."""
+    sink = InMemoryLogSink(log_dir=tmp_path)
+    
+    sink.write(_entry("a", datetime(2025, 1, 1, 9)))
+    sink.write_batch([
+        _entry("b", datetime(2025, 1, 1, 10, 0, 0, 123000), job_id=7, context={"x": 1}),
+        _entry("c", datetime(2025, 1, 2, 8)),
+    ])
+    
+    first_day = (tmp_path / "2025-01-01.log").read_text(encoding=Constants.LOG_FILE_ENCODING)
+    second_day = (tmp_path / "2025-01-02.log").read_text(encoding=Constants.LOG_FILE_ENCODING)
+    assert first_day == (
+        "[2025-01-01 09:00:00.000] [INFO] a\n"
+        '[2025-01-01 10:00:00.123] [INFO] [Job:7] b | {"x":1}\n'
+    )
+    assert second_day == "[2025-01-02 08:00:00.000] [INFO] c\n"
@@ -3,15 +3,47 @@
 비결정적 요소를 제거하여 OS/환경 독립적인 스냅샷 비교를 가능하게 합니다.
 """
 
+import hashlib
+import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+# 비결정 필드 (정확한 필드명만 매칭, 모듈 로드 시 한 번만 생성)
+_DROP = frozenset({
+    'mtime', 'created_at', 'updated_at', 'timestamp', 'duration',
+    'memory_usage', 'cpu_time', 'process_id', 'thread_id', 'pid', 'tid',
+    'random_id', 'session_id', 'request_id'
+})
+
+# 스택으로 순회하는 컨테이너 타입 (그 외는 원시 값으로 정규화)
+_CONTAINER_TYPES = (dict, list, set, frozenset)
+
+# 이보다 큰 컨테이너만 id() 메모이제이션 (작은 노드는 조회 비용이 더 큼)
+_MEMO_MIN_SIZE = 8
+
+# 유지해야 하는 ID 필드들
+_PRESERVED_IDS = frozenset({
+    'file_id', 'group_id', 'issue_id', 'action_id', 'canonical_id',
+    'member_ids', 'id'  # 일반적인 'id'도 유지
+})
+
 
 def normalize_snapshot(data: Any, base_path: Optional[Path] = None) -> Any:
     """스냅샷 정규화 (비결정적 요소 제거).
     
+    재귀 호출 대신 명시적 작업 스택으로 트리를 순회한다. 컨테이너는 먼저
+    생성해 부모에 연결하고, 자식 컨테이너는 스택에서 꺼낼 때 채운다.
+    원시 값 자식은 스택을 거치지 않고 바로 정규화한다.
+    
     Args:
         data: 정규화할 데이터 (dict, list, primitive 등)
         base_path: 기준 경로 (절대 경로를 상대 경로로 변환할 때 사용)
@@ -19,62 +51,84 @@ def normalize_snapshot(data: Any, base_path: Optional[Path] = None) -> Any:
     Returns:
         정규화된 데이터
     """
-    if isinstance(data, dict):
-        return _normalize_dict(data, base_path)
-    elif isinstance(data, list):
-        return _normalize_list(data, base_path)
-    elif isinstance(data, (set, frozenset)):
-        return _normalize_list(sorted(data, key=_sort_key), base_path)
-    elif isinstance(data, (int, bool, type(None))):
-        return data
-    elif isinstance(data, float):
-        return round(data, 6)  # 소수점 6자리로 반올림
-    elif isinstance(data, str):
-        return _normalize_string(data, base_path)
+    if not isinstance(data, _CONTAINER_TYPES):
+        return _normalize_scalar(data, base_path)
+    
+    root: List[Any] = [None]
+    # (부모 컨테이너, 키/인덱스, 원본 컨테이너)
+    stack: List[tuple] = [(root, 0, data)]
+    # 공유된 큰 서브트리는 한 번만 정규화 (입력이 살아 있는 동안 id()는 고유)
+    memo: Dict[int, Any] = {}
+    
+    while stack:
+        parent, key, value = stack.pop()
+        
+        memoize = len(value) > _MEMO_MIN_SIZE
+        if memoize:
+            cached = memo.get(id(value))
+            if cached is not None:
+                parent[key] = cached
+                continue
+        
+        # 정확한 타입은 테이블 조회, 하위 클래스만 isinstance로 판별
+        handler = _CONTAINER_DISPATCH.get(type(value))
+        if handler is None:
+            handler = _normalize_dict if isinstance(value, dict) else _normalize_list
+        
+        result = handler(value, stack, base_path)
+        if memoize:
+            memo[id(value)] = result
+        parent[key] = result
+    
+    return root[0]
+
+
+def _normalize_scalar(value: Any, base_path: Optional[Path] = None) -> Any:
+    """원시 값 정규화."""
+    if isinstance(value, (int, bool, type(None))):
+        return value
+    elif isinstance(value, float):
+        return round(value, 6)  # 소수점 6자리로 반올림
+    elif isinstance(value, str):
+        return _normalize_string(value, base_path)
     else:
         # 기타 타입은 문자열로 변환
-        return str(data)
+        return str(value)
 
 
-def _normalize_dict(data: Dict[str, Any], base_path: Optional[Path] = None) -> Dict[str, Any]:
-    """딕셔너리 정규화."""
-    # 비결정 필드 제거 (정확한 필드명만 매칭)
-    non_deterministic_fields = {
-        'mtime', 'created_at', 'updated_at', 'timestamp', 'duration',
-        'memory_usage', 'cpu_time', 'process_id', 'thread_id', 'pid', 'tid',
-        'random_id', 'session_id', 'request_id'
-    }
-    
-    # 유지해야 하는 ID 필드들
-    preserved_id_fields = {
-        'file_id', 'group_id', 'issue_id', 'action_id', 'canonical_id', 
-        'member_ids', 'id'  # 일반적인 'id'도 유지
-    }
-    
+def _normalize_dict(
+    data: Dict[str, Any], stack: List[tuple], base_path: Optional[Path] = None
+) -> Dict[str, Any]:
+    """딕셔너리 정규화 (키 정렬, 자식 컨테이너는 스택에 추가)."""
     result = {}
-    for key, value in sorted(data.items(), key=lambda x: _sort_key(x[0])):
+    for key, value in sorted(data.items(), key=_item_sort_key):
         key_lower = key.lower()
         
-        # 비결정 필드 체크 (정확한 매칭만)
-        if key_lower in non_deterministic_fields:
-            continue
-        
-        # 타임스탬프 관련 필드 체크 (정확한 필드명만)
-        if key_lower in ['mtime', 'created_at', 'updated_at', 'timestamp', 'duration']:
+        # 비결정 필드 체크 (정확한 매칭만, 타임스탬프 필드 포함)
+        if key_lower in _DROP:
             continue
         
         # UUID 필드 체크
-        if 'uuid' in key_lower and key not in preserved_id_fields:
+        if 'uuid' in key_lower and key not in _PRESERVED_IDS:
             continue
         
-        normalized_value = normalize_snapshot(value, base_path)
-        result[key] = normalized_value
+        if isinstance(value, _CONTAINER_TYPES):
+            # 키 순서를 유지하도록 자리만 잡아두고 값은 스택에서 채움
+            result[key] = None
+            stack.append((result, key, value))
+        else:
+            result[key] = _normalize_scalar(value, base_path)
     
     return result
 
 
-def _normalize_list(data: List[Any], base_path: Optional[Path] = None) -> List[Any]:
-    """리스트 정규화 (stable sort)."""
+def _normalize_list(
+    data: Any, stack: List[tuple], base_path: Optional[Path] = None
+) -> List[Any]:
+    """리스트/집합 정규화 (stable sort, 자식 컨테이너는 스택에 추가)."""
+    if isinstance(data, (set, frozenset)):
+        data = sorted(data, key=_sort_key)
+    
     if not data:
         return []
     
@@ -83,31 +137,65 @@ def _normalize_list(data: List[Any], base_path: Optional[Path] = None) -> List[A
     
     if isinstance(first_elem, dict):
         # 딕셔너리 리스트: file_id, group_id, id 등으로 정렬
-        sort_key_fn = lambda x: (
-            x.get('file_id', 0) if isinstance(x, dict) else 0,
-            x.get('group_id', 0) if isinstance(x, dict) else 0,
-            x.get('issue_id', 0) if isinstance(x, dict) else 0,
-            x.get('id', 0) if isinstance(x, dict) else 0,  # 일반 'id' 필드도 정렬 키로 사용
-            str(x.get('path', '')) if isinstance(x, dict) else str(x),
-        )
-        sorted_data = sorted(data, key=sort_key_fn)
+        sorted_data = sorted(data, key=_dict_sort_key)
     elif isinstance(first_elem, (int, float, str)):
         # 원시 타입 리스트: 직접 정렬
         sorted_data = sorted(data, key=_sort_key)
     else:
         # 기타 타입: 문자열로 변환하여 정렬
-        sorted_data = sorted(data, key=lambda x: str(x))
+        sorted_data = sorted(data, key=str)
     
-    return [normalize_snapshot(item, base_path) for item in sorted_data]
+    result: List[Any] = [None] * len(sorted_data)
+    for i, item in enumerate(sorted_data):
+        if isinstance(item, _CONTAINER_TYPES):
+            stack.append((result, i, item))
+        else:
+            result[i] = _normalize_scalar(item, base_path)
+    return result
+
+
+def _item_sort_key(item: tuple) -> Any:
+    """딕셔너리 항목 정렬 키 (키 기준)."""
+    return _sort_key(item[0])
+
+
+def _dict_sort_key(x: Any) -> tuple:
+    """딕셔너리 리스트 정렬 키 (file_id, group_id, issue_id, id, path 순)."""
+    if not isinstance(x, dict):
+        return (0, 0, 0, 0, str(x))
+    get = x.get
+    return (
+        get('file_id', 0),
+        get('group_id', 0),
+        get('issue_id', 0),
+        get('id', 0),  # 일반 'id' 필드도 정렬 키로 사용
+        str(get('path', '')),
+    )
 
 
 def _normalize_string(value: str, base_path: Optional[Path] = None) -> str:
     """문자열 정규화 (경로 처리)."""
+    # 경로 구분자가 없으면 경로가 아니므로 그대로 반환
+    if '/' not in value and '\\' not in value:
+        return value
+    
+    return _normalize_path_cached(value, str(base_path) if base_path else "")
+
+
+@lru_cache(maxsize=65536)
+def _normalize_path_cached(value: str, base_path_str: str) -> str:
+    """경로 문자열 정규화 (같은 경로/기준 경로 조합은 캐시).
+    
+    Args:
+        value: 정규화할 문자열
+        base_path_str: 기준 경로 문자열 (없으면 빈 문자열)
+    
+    Returns:
+        정규화된 문자열
+    """
     # 경로 정규화: 절대 경로를 상대 경로로 변환
-    if base_path and os.path.isabs(value):
+    if base_path_str and os.path.isabs(value):
         try:
-            # Path 객체를 문자열로 변환
-            base_path_str = str(base_path)
             # 상대 경로로 변환 시도
             rel_path = os.path.relpath(value, base_path_str)
             # OS 경로 구분자 통일 (백슬래시 → 슬래시)
@@ -137,6 +225,37 @@ def _sort_key(value: Any) -> Any:
         return (4, str(value))
 
 
+# 컨테이너 타입별 정규화 함수 (스택 순회 시 type()으로 바로 조회)
+_CONTAINER_DISPATCH = {
+    dict: _normalize_dict,
+    list: _normalize_list,
+    set: _normalize_list,
+    frozenset: _normalize_list,
+}
+
+
+def snapshot_fingerprint(data: Any) -> str:
+    """정규화된 스냅샷의 지문 (키 정렬된 JSON의 BLAKE2b-128 hex).
+    
+    큰 스냅샷은 전체 구조를 비교하는 대신 저장된 지문과 비교한다.
+    orjson과 표준 json 모두 공백 없는 UTF-8을 해시한다 (단, 지수 표기 실수는
+    ``1e-6``/``1e-06``처럼 직렬화기마다 표기가 달라 지문이 달라질 수 있음).
+    
+    Args:
+        data: 정규화된 데이터 (JSON 직렬화 가능)
+    
+    Returns:
+        32자리 hex 문자열
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(
+            data, sort_keys=True, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 def remove_timestamps(data: Dict[str, Any]) -> Dict[str, Any]:
     """타임스탬프 제거 (추가 유틸리티)."""
     result = {}
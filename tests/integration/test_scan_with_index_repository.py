@@ -1,14 +1,13 @@
 """스캔과 인덱스 저장소 통합 테스트."""
-import sys
-import tempfile
+import sqlite3
 from pathlib import Path
+from typing import Callable, Optional
 
 import pytest
 
-# 프로젝트 루트를 sys.path에 추가
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
-
+from application.dto.run_summary import RunSummary
+from application.dto.scan_request import ScanRequest
+from application.dto.scan_result import ScanResult
 from application.use_cases.scan_folder import ScanFolderUseCase
 from domain.entities.file_entry import FileEntry
 from infrastructure.db.sqlite_index_repository import SQLiteIndexRepository
@@ -17,50 +16,90 @@ from infrastructure.logging.in_memory_log_sink import InMemoryLogSink
 from tests.fixtures import FIXTURES_DIR
 
 
-@pytest.fixture
-def temp_db() -> Path:
-    """임시 DB 파일 경로 생성."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-        db_path = Path(f.name)
-    yield db_path
-    # 테스트 후 정리
-    if db_path.exists():
-        db_path.unlink()
-
-
-@pytest.fixture
-def index_repo(temp_db: Path) -> SQLiteIndexRepository:
-    """SQLiteIndexRepository 인스턴스 생성."""
-    return SQLiteIndexRepository(db_path=temp_db)
-
-
-@pytest.fixture
-def log_sink() -> InMemoryLogSink:
-    """InMemoryLogSink 인스턴스 생성."""
-    return InMemoryLogSink()
+class _FixedScanner:
+    """세션 스캔 결과를 그대로 돌려주는 스캐너 (DB 기록 테스트용)."""
+    
+    def __init__(self, entries: list[FileEntry]) -> None:
+        self._entries = entries
+    
+    def scan(
+        self,
+        request: ScanRequest,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+    ) -> list[FileEntry]:
+        return list(self._entries)
+    
+    def cancel(self) -> None:
+        pass
 
 
-def test_scan_saves_to_index_repository(index_repo: SQLiteIndexRepository, log_sink: InMemoryLogSink) -> None:
-    """스캔 실행 시 DB에 기록되는지 테스트."""
-    from application.dto.scan_request import ScanRequest
+class _FailingIndexRepository:
+    """Run 시작 후 파일 저장과 Run 완료가 실패하는 인덱스 저장소."""
     
-    # Fixture 디렉토리 사용
-    fixture_path = FIXTURES_DIR / "small"
+    def start_run(self, request: ScanRequest) -> int:
+        return 1
     
-    scanner = FileSystemScanner()
-    use_case = ScanFolderUseCase(scanner, index_repository=index_repo, log_sink=log_sink)
+    def upsert_files(self, run_id: int, entries: list[FileEntry]) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
     
-    request = ScanRequest(
-        root_folder=fixture_path,
+    def finalize_run(self, run_id: int, summary: RunSummary) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+
+@pytest.fixture(scope="session")
+def scan_request() -> ScanRequest:
+    """small 픽스처 스캔 요청."""
+    return ScanRequest(
+        root_folder=FIXTURES_DIR / "small",
         extensions=[".txt"],
         include_subdirs=True,
         include_hidden=False,
         include_symlinks=True,
         incremental=True,
     )
+
+
+@pytest.fixture(scope="session")
+def scanned_small_fixture(
+    scan_request: ScanRequest, tmp_path_factory
+) -> tuple[ScanResult, list[FileEntry]]:
+    """small 픽스처를 세션당 한 번만 스캔 (읽기 전용으로 사용)."""
+    log_sink = InMemoryLogSink(log_dir=tmp_path_factory.mktemp("scan_logs"))
+    use_case = ScanFolderUseCase(FileSystemScanner(), log_sink=log_sink)
+    result = use_case.execute(scan_request)
+    return result, list(result.entries)
+
+
+@pytest.fixture
+def fixed_scanner(scanned_small_fixture) -> _FixedScanner:
+    """세션 스캔 결과를 돌려주는 스캐너 (DB 기록 테스트용)."""
+    _result, entries = scanned_small_fixture
+    return _FixedScanner(entries)
+
+
+@pytest.fixture
+def index_repo(tmp_path: Path) -> SQLiteIndexRepository:
+    """테스트마다 새 DB 파일을 쓰는 SQLiteIndexRepository."""
+    return SQLiteIndexRepository(db_path=tmp_path / "index.db")
+
+
+@pytest.fixture
+def log_sink(tmp_path: Path) -> InMemoryLogSink:
+    """InMemoryLogSink 인스턴스 생성 (로그 파일은 임시 디렉토리에 기록)."""
+    return InMemoryLogSink(log_dir=tmp_path / "logs")
+
+
+def test_scan_saves_to_index_repository(
+    index_repo: SQLiteIndexRepository,
+    log_sink: InMemoryLogSink,
+    fixed_scanner: _FixedScanner,
+    scan_request: ScanRequest,
+) -> None:
+    """스캔 실행 시 DB에 기록되는지 테스트."""
+    use_case = ScanFolderUseCase(fixed_scanner, index_repository=index_repo, log_sink=log_sink)
     
     # 스캔 실행
-    result = use_case.execute(request)
+    result = use_case.execute(scan_request)
     
     # 결과가 정상 반환되는지 확인
     assert result.total_files > 0
@@ -81,68 +120,44 @@ def test_scan_saves_to_index_repository(index_repo: SQLiteIndexRepository, log_s
     assert len(files) == result.total_files
 
 
-def test_scan_with_index_repo_failure_still_returns_result(log_sink: InMemoryLogSink) -> None:
+def test_scan_with_index_repo_failure_still_returns_result(
+    log_sink: InMemoryLogSink,
+    fixed_scanner: _FixedScanner,
+    scan_request: ScanRequest,
+) -> None:
     """인덱스 저장소 실패 시에도 스캔 결과는 정상 반환되는지 테스트."""
-    from application.dto.scan_request import ScanRequest
-    
-    # 잘못된 DB 경로로 Repository 생성 (실패 유도)
-    invalid_db_path = Path("/invalid/path/that/does/not/exist/index.db")
-    
-    # 부모 디렉토리가 없으므로 초기화는 실패할 수 있지만, 
-    # 실제로는 경로 생성 시 문제가 발생할 수 있음
-    # 대신 Mock 또는 실패하는 Repository를 만들거나,
-    # 실제로는 DB 생성이 실패해도 스캔은 진행되어야 함
-    
-    # 간단한 방법: 실제 Repository를 사용하되, 스캔 후 DB를 삭제하여
-    # "실패 시에도 결과 반환"을 확인하는 것은 실제로는 어려움
-    # 이 테스트는 실제로는 UseCase의 try-except 로직을 검증하는 것
-    
-    fixture_path = FIXTURES_DIR / "small"
-    scanner = FileSystemScanner()
-    
-    # index_repo 없이 실행 (기본 동작)
-    use_case = ScanFolderUseCase(scanner, log_sink=log_sink)
-    
-    request = ScanRequest(
-        root_folder=fixture_path,
-        extensions=[".txt"],
-        include_subdirs=True,
-        include_hidden=False,
-        include_symlinks=True,
-        incremental=True,
+    use_case = ScanFolderUseCase(
+        fixed_scanner, index_repository=_FailingIndexRepository(), log_sink=log_sink
     )
     
-    # 스캔 실행 (index_repo가 없어도 정상 동작)
-    result = use_case.execute(request)
+    # 스캔 실행 (저장소 예외는 UseCase가 로그로만 남김)
+    result = use_case.execute(scan_request)
     
     # 결과가 정상 반환되는지 확인
     assert result.total_files > 0
     assert result.total_bytes > 0
+    
+    # 저장 실패가 ERROR 로그로 기록되었는지 확인
+    error_messages = [log.message for log in log_sink.get_logs(level="ERROR")]
+    assert any(m.startswith("Failed to save files to index repository") for m in error_messages)
+    assert any(m.startswith("Failed to finalize run in index repository") for m in error_messages)
 
 
-def test_app_restart_can_retrieve_previous_run(index_repo: SQLiteIndexRepository, log_sink: InMemoryLogSink) -> None:
+def test_app_restart_can_retrieve_previous_run(
+    index_repo: SQLiteIndexRepository,
+    log_sink: InMemoryLogSink,
+    fixed_scanner: _FixedScanner,
+    scan_request: ScanRequest,
+) -> None:
     """앱 재시작 후 이전 Run 조회 가능 테스트."""
-    from application.dto.scan_request import ScanRequest
-    
-    fixture_path = FIXTURES_DIR / "small"
-    scanner = FileSystemScanner()
-    use_case = ScanFolderUseCase(scanner, index_repository=index_repo, log_sink=log_sink)
-    
-    request = ScanRequest(
-        root_folder=fixture_path,
-        extensions=[".txt"],
-        include_subdirs=True,
-        include_hidden=False,
-        include_symlinks=True,
-        incremental=True,
-    )
+    use_case = ScanFolderUseCase(fixed_scanner, index_repository=index_repo, log_sink=log_sink)
     
     # 첫 번째 스캔
-    result1 = use_case.execute(request)
+    result1 = use_case.execute(scan_request)
     run_id1 = index_repo.get_latest_run_id()
     
     # 두 번째 스캔 (앱 재시작 시뮬레이션)
-    result2 = use_case.execute(request)
+    result2 = use_case.execute(scan_request)
     run_id2 = index_repo.get_latest_run_id()
     
     # 두 Run 모두 존재하는지 확인
@@ -157,29 +172,21 @@ def test_app_restart_can_retrieve_previous_run(index_repo: SQLiteIndexRepository
     assert summary2.run_id == run_id2
 
 
-def test_logs_are_recorded_during_scan(index_repo: SQLiteIndexRepository, log_sink: InMemoryLogSink) -> None:
+def test_logs_are_recorded_during_scan(
+    index_repo: SQLiteIndexRepository,
+    log_sink: InMemoryLogSink,
+    fixed_scanner: _FixedScanner,
+    scan_request: ScanRequest,
+) -> None:
     """스캔 중 로그가 기록되는지 테스트."""
-    from application.dto.scan_request import ScanRequest
-    
-    fixture_path = FIXTURES_DIR / "small"
-    scanner = FileSystemScanner()
-    use_case = ScanFolderUseCase(scanner, index_repository=index_repo, log_sink=log_sink)
-    
-    request = ScanRequest(
-        root_folder=fixture_path,
-        extensions=[".txt"],
-        include_subdirs=True,
-        include_hidden=False,
-        include_symlinks=True,
-        incremental=True,
-    )
+    use_case = ScanFolderUseCase(fixed_scanner, index_repository=index_repo, log_sink=log_sink)
     
     # 초기 로그 수
     initial_logs = log_sink.get_logs()
     initial_count = len(initial_logs)
     
     # 스캔 실행
-    result = use_case.execute(request)
+    result = use_case.execute(scan_request)
     
     # 로그가 추가되었는지 확인 (에러가 없으면 INFO 로그는 없을 수 있지만,
     # DB 저장은 수행되므로 최소한 성공 로그는 있을 수 있음)
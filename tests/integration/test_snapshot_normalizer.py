@@ -1,6 +1,7 @@
 """스냅샷 정규화 헬퍼 검증 테스트."""
 
 import os
+import platform
 import sys
 from pathlib import Path
 
@@ -8,7 +9,11 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from tests.integration.snapshot_normalizer import normalize_snapshot
+from tests.integration.snapshot_normalizer import normalize_snapshot, snapshot_fingerprint
+
+
+# test_normalize_nested_structure 기대 결과의 지문
+_NESTED_STRUCTURE_FINGERPRINT = "3ebfd92736d75379f75f34c32ad6b3e4"
 
 
 def test_normalize_dict_order():
@@ -21,6 +26,7 @@ def test_normalize_dict_order():
     
     assert normalized1 == normalized2, "딕셔너리 순서 정규화 실패"
     assert list(normalized1.keys()) == ["a", "b", "c"], "딕셔너리 키 정렬 실패"
+    assert list(normalized2.keys()) == ["a", "b", "c"], "딕셔너리 키 정렬 실패"
 
 
 def test_normalize_list_order():
@@ -37,9 +43,6 @@ def test_normalize_list_order():
 
 def test_normalize_path_absolute_to_relative():
     """절대 경로를 상대 경로로 변환 테스트."""
-    import os
-    import platform
-    
     # 플랫폼에 맞는 경로 사용
     if platform.system() == "Windows":
         base_path = Path("C:/project")
@@ -138,6 +141,34 @@ def test_normalize_nested_structure():
     assert list(normalized["metadata"].keys()) == ["x", "y", "z"], "중첩 딕셔너리 정렬 실패"
 
 
+def test_normalize_nested_structure_fingerprint():
+    """중첩 구조 정규화 결과를 저장된 지문과 비교 (입력 순서와 무관)."""
+    data = {
+        "metadata": {"y": 2, "z": 3, "x": 1},
+        "groups": [
+            {"name": "B", "id": 2},
+            {"name": "C", "id": 3},
+            {"name": "A", "id": 1}
+        ]
+    }
+    
+    assert snapshot_fingerprint(normalize_snapshot(data)) == _NESTED_STRUCTURE_FINGERPRINT, (
+        "중첩 구조 지문 불일치"
+    )
+
+
+def test_normalize_shared_subtree():
+    """공유 서브트리 정규화 테스트 (같은 객체를 여러 번 참조)."""
+    shared = {f"key{i}": [3, 1, 2] for i in range(10)}
+    data = {"a": shared, "b": [shared, shared]}
+    
+    normalized = normalize_snapshot(data)
+    
+    expected = {f"key{i}": [1, 2, 3] for i in range(10)}
+    assert normalized["a"] == expected, "공유 서브트리 정규화 실패"
+    assert normalized["b"] == [expected, expected], "공유 서브트리 정규화 실패"
+
+
 if __name__ == "__main__":
     print("스냅샷 정규화 테스트 실행 중...")
     test_normalize_dict_order()
@@ -161,4 +192,10 @@ if __name__ == "__main__":
     test_normalize_nested_structure()
     print("✓ 중첩 구조 정규화 테스트 통과")
     
+    test_normalize_nested_structure_fingerprint()
+    print("✓ 중첩 구조 지문 테스트 통과")
+    
+    test_normalize_shared_subtree()
+    print("✓ 공유 서브트리 정규화 테스트 통과")
+    
     print("\n모든 스냅샷 정규화 테스트 통과!")
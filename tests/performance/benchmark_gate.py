@@ -4,9 +4,20 @@
 """
 
 import json
+import statistics
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+# 처리량 게이트 최소 임계값 (%, 허용 오차가 더 작아도 이보다 엄격해지지 않음)
+_SOFT_GATE_PERCENT = 5.0
+_HARD_GATE_PERCENT = 10.0
 
 
 def check_performance_gate(
@@ -24,8 +35,10 @@ def check_performance_gate(
     Returns:
         통과 여부 (True: 통과, False: 실패)
     """
-    print(f"성능 게이트 체크 시작 (환경: {env})...")
-    print()
+    # 출력 라인 - 모든 체크가 끝난 뒤 한 번에 출력
+    lines: List[str] = []
+    lines.append(f"성능 게이트 체크 시작 (환경: {env})...")
+    lines.append("")
     
     passed = True
     warnings = []
@@ -34,11 +47,11 @@ def check_performance_gate(
     # 1. 스캔 처리량 체크
     if "scan_throughput" in measured and "scan_throughput" in baseline:
         metric_name = "스캔 처리량 (files/sec)"
-        measured_value = measured["scan_throughput"].get("files_per_sec", 0)
-        baseline_value = baseline["scan_throughput"].get("files_per_sec", 0)
-        tolerance = baseline["scan_throughput"].get("tolerance", 0.05)
+        measured_value = _center(measured["scan_throughput"], "files_per_sec", "median_files_per_sec")
+        baseline_value = _center(baseline["scan_throughput"], "files_per_sec", "median_files_per_sec")
+        tolerance = _effective_tolerance(baseline["scan_throughput"], "throughput", baseline_value)
         
-        result = _check_metric(metric_name, measured_value, baseline_value, tolerance, env)
+        result = _check_metric(metric_name, measured_value, baseline_value, tolerance, env, lines)
         if result == "error":
             errors.append(metric_name)
             passed = False
@@ -48,11 +61,17 @@ def check_performance_gate(
     # 2. 중복 탐지 처리량 체크 (비교 속도 기준)
     if "duplicate_detection" in measured and "duplicate_detection" in baseline:
         metric_name = "중복 탐지 (comparisons/sec)"
-        measured_value = measured["duplicate_detection"].get("comparisons_per_sec", 0)
-        baseline_value = baseline["duplicate_detection"].get("comparisons_per_sec", 0)
-        tolerance = baseline["duplicate_detection"].get("tolerance", 0.05)
+        measured_value = _center(
+            measured["duplicate_detection"], "comparisons_per_sec", "median_comparisons_per_sec"
+        )
+        baseline_value = _center(
+            baseline["duplicate_detection"], "comparisons_per_sec", "median_comparisons_per_sec"
+        )
+        tolerance = _effective_tolerance(
+            baseline["duplicate_detection"], "comparisons_per_sec", baseline_value
+        )
         
-        result = _check_metric(metric_name, measured_value, baseline_value, tolerance, env)
+        result = _check_metric(metric_name, measured_value, baseline_value, tolerance, env, lines)
         if result == "error":
             errors.append(metric_name)
             passed = False
@@ -73,20 +92,20 @@ def check_performance_gate(
                 if env == "ci":
                     errors.append(metric_name)
                     passed = False
-                    print(f"❌ {metric_name}: {measured_value:.2f} MB (기준선: {baseline_value:.2f} MB)")
-                    print(f"   → 증가율 {diff_percent:.1f}% (기준선 +10% 초과)")
+                    lines.append(f"❌ {metric_name}: {measured_value:.2f} MB (기준선: {baseline_value:.2f} MB)")
+                    lines.append(f"   → 증가율 {diff_percent:.1f}% (기준선 +10% 초과)")
                 else:
                     warnings.append(metric_name)
-                    print(f"⚠️  {metric_name}: {measured_value:.2f} MB (기준선: {baseline_value:.2f} MB)")
-                    print(f"   → 증가율 {diff_percent:.1f}% (기준선 +10% 초과)")
+                    lines.append(f"⚠️  {metric_name}: {measured_value:.2f} MB (기준선: {baseline_value:.2f} MB)")
+                    lines.append(f"   → 증가율 {diff_percent:.1f}% (기준선 +10% 초과)")
             elif diff_percent > 5:  # soft gate
                 warnings.append(metric_name)
-                print(f"⚠️  {metric_name}: {measured_value:.2f} MB (기준선: {baseline_value:.2f} MB)")
-                print(f"   → 증가율 {diff_percent:.1f}% (기준선 +5% 초과)")
+                lines.append(f"⚠️  {metric_name}: {measured_value:.2f} MB (기준선: {baseline_value:.2f} MB)")
+                lines.append(f"   → 증가율 {diff_percent:.1f}% (기준선 +5% 초과)")
             else:
-                print(f"✓ {metric_name}: {measured_value:.2f} MB (기준선: {baseline_value:.2f} MB)")
+                lines.append(f"✓ {metric_name}: {measured_value:.2f} MB (기준선: {baseline_value:.2f} MB)")
         else:
-            print(f"✓ {metric_name}: {measured_value:.2f} MB (기준선: {baseline_value:.2f} MB, 개선됨)")
+            lines.append(f"✓ {metric_name}: {measured_value:.2f} MB (기준선: {baseline_value:.2f} MB, 개선됨)")
     
     # 4. CPU 시간 체크
     if "cpu_time" in measured and "cpu_time" in baseline:
@@ -102,76 +121,117 @@ def check_performance_gate(
                 if env == "ci":
                     errors.append(metric_name)
                     passed = False
-                    print(f"❌ {metric_name}: {measured_value:.3f} sec (기준선: {baseline_value:.3f} sec)")
-                    print(f"   → 증가율 {diff_percent:.1f}% (기준선 +10% 초과)")
+                    lines.append(f"❌ {metric_name}: {measured_value:.3f} sec (기준선: {baseline_value:.3f} sec)")
+                    lines.append(f"   → 증가율 {diff_percent:.1f}% (기준선 +10% 초과)")
                 else:
                     warnings.append(metric_name)
-                    print(f"⚠️  {metric_name}: {measured_value:.3f} sec (기준선: {baseline_value:.3f} sec)")
-                    print(f"   → 증가율 {diff_percent:.1f}% (기준선 +10% 초과)")
+                    lines.append(f"⚠️  {metric_name}: {measured_value:.3f} sec (기준선: {baseline_value:.3f} sec)")
+                    lines.append(f"   → 증가율 {diff_percent:.1f}% (기준선 +10% 초과)")
             elif diff_percent > 5:  # soft gate
                 warnings.append(metric_name)
-                print(f"⚠️  {metric_name}: {measured_value:.3f} sec (기준선: {baseline_value:.3f} sec)")
-                print(f"   → 증가율 {diff_percent:.1f}% (기준선 +5% 초과)")
+                lines.append(f"⚠️  {metric_name}: {measured_value:.3f} sec (기준선: {baseline_value:.3f} sec)")
+                lines.append(f"   → 증가율 {diff_percent:.1f}% (기준선 +5% 초과)")
         else:
-            print(f"✓ {metric_name}: 통과")
+            lines.append(f"✓ {metric_name}: 통과")
     
     # 요약
-    print()
-    print("=" * 60)
+    lines.append("")
+    lines.append("=" * 60)
     if passed:
-        print("✓ 성능 게이트 통과!")
+        lines.append("✓ 성능 게이트 통과!")
         if warnings:
-            print(f"  경고 {len(warnings)}개: {', '.join(warnings)}")
+            lines.append(f"  경고 {len(warnings)}개: {', '.join(warnings)}")
     else:
-        print("❌ 성능 게이트 실패!")
-        print(f"  오류 {len(errors)}개: {', '.join(errors)}")
+        lines.append("❌ 성능 게이트 실패!")
+        lines.append(f"  오류 {len(errors)}개: {', '.join(errors)}")
         if warnings:
-            print(f"  경고 {len(warnings)}개: {', '.join(warnings)}")
+            lines.append(f"  경고 {len(warnings)}개: {', '.join(warnings)}")
         
         if env == "ci":
-            print()
-            print("PR BLOCKED: 성능 기준 미달")
-    print("=" * 60)
+            lines.append("")
+            lines.append("PR BLOCKED: 성능 기준 미달")
+    lines.append("=" * 60)
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return passed
 
 
+def _center(section: Dict[str, Any], mean_key: str, median_key: str) -> float:
+    """비교 기준값 (중앙값이 있으면 중앙값, 없으면 평균)."""
+    if median_key in section:
+        return section[median_key]
+    return section.get(mean_key, 0)
+
+
+def _effective_tolerance(section: Dict[str, Any], run_key: str, center: float) -> float:
+    """실행 간 편차를 반영한 허용 오차.
+    
+    기준선 ``runs``의 중앙값 절대 편차(MAD)로 ``max(tolerance, 2 * MAD / 중앙값)``을
+    계산한다. 한 번의 이상치 실행으로 게이트가 뒤집히지 않도록 하되,
+    기준선이 안정적이면 원래 허용 오차를 그대로 쓴다.
+    """
+    tolerance = section.get("tolerance", 0.05)
+    values = [run[run_key] for run in section.get("runs", []) if run_key in run]
+    if len(values) < 2 or center <= 0:
+        return tolerance
+    
+    median = statistics.median(values)
+    mad = statistics.median(abs(value - median) for value in values)
+    return max(tolerance, 2 * mad / center)
+
+
 def _check_metric(
     name: str,
     measured: float,
     baseline: float,
     tolerance: float,
-    env: str
+    env: str,
+    lines: List[str]
 ) -> str:
     """단일 메트릭 체크.
     
+    ``max(5%, tolerance)`` 초과 시 경고(soft gate), ``max(10%, 그 두 배)`` 초과 시
+    CI에서 실패(hard gate). 기본 허용 오차(0.05)에서는 고정 5%/10% 게이트와 같다.
+    결과 라인은 출력하지 않고 ``lines``에 추가한다.
+    
     Returns:
         "ok" | "warning" | "error"
     """
     if baseline == 0:
-        print(f"⚠️  {name}: 기준선이 0이므로 체크 불가")
+        lines.append(f"⚠️  {name}: 기준선이 0이므로 체크 불가")
         return "warning"
     
     diff_percent = abs(measured - baseline) / baseline * 100
+    soft_percent = max(_SOFT_GATE_PERCENT, tolerance * 100)
+    hard_percent = max(_HARD_GATE_PERCENT, soft_percent * 2)
     
-    if diff_percent > 10:  # hard gate
+    if diff_percent > hard_percent:  # hard gate
         if env == "ci":
-            print(f"❌ {name}: {measured:.2f} (기준선: {baseline:.2f})")
-            print(f"   → 차이 {diff_percent:.1f}% (기준선 ±10% 초과)")
+            lines.append(f"❌ {name}: {measured:.2f} (기준선: {baseline:.2f})")
+            lines.append(f"   → 차이 {diff_percent:.1f}% (기준선 ±{hard_percent:.0f}% 초과)")
             return "error"
         else:
-            print(f"⚠️  {name}: {measured:.2f} (기준선: {baseline:.2f})")
-            print(f"   → 차이 {diff_percent:.1f}% (기준선 ±10% 초과)")
+            lines.append(f"⚠️  {name}: {measured:.2f} (기준선: {baseline:.2f})")
+            lines.append(f"   → 차이 {diff_percent:.1f}% (기준선 ±{hard_percent:.0f}% 초과)")
             return "warning"
-    elif diff_percent > 5:  # soft gate
-        print(f"⚠️  {name}: {measured:.2f} (기준선: {baseline:.2f})")
-        print(f"   → 차이 {diff_percent:.1f}% (기준선 ±5% 초과)")
+    elif diff_percent > soft_percent:  # soft gate
+        lines.append(f"⚠️  {name}: {measured:.2f} (기준선: {baseline:.2f})")
+        lines.append(f"   → 차이 {diff_percent:.1f}% (기준선 ±{soft_percent:.0f}% 초과)")
         return "warning"
     else:
-        print(f"✓ {name}: {measured:.2f} (기준선: {baseline:.2f})")
+        lines.append(f"✓ {name}: {measured:.2f} (기준선: {baseline:.2f})")
         return "ok"
 
 
+def _load_json(path: Path) -> Dict[str, Any]:
+    """JSON 파일 로드 (orjson이 있으면 바이트를 직접 파싱)."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def main() -> None:
     """메인 함수."""
     if len(sys.argv) < 2:
@@ -192,11 +252,8 @@ def main() -> None:
         print(f"오류: 기준선 파일을 찾을 수 없습니다: {baseline_path}")
         sys.exit(1)
     
-    with open(measured_path, 'r', encoding='utf-8') as f:
-        measured = json.load(f)
-    
-    with open(baseline_path, 'r', encoding='utf-8') as f:
-        baseline = json.load(f)
+    measured = _load_json(measured_path)
+    baseline = _load_json(baseline_path)
     
     # 게이트 체크
     passed = check_performance_gate(measured, baseline, env)
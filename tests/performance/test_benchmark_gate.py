@@ -0,0 +1,66 @@
+"""성능 게이트 판정 로직 테스트."""
+
+import pytest
+
+from tests.performance.benchmark_gate import _center, _check_metric, _effective_tolerance
+
+
+@pytest.mark.parametrize("section,expected", [
+    ({"files_per_sec": 100.0, "median_files_per_sec": 90.0}, 90.0),
+    ({"files_per_sec": 100.0}, 100.0),
+    ({}, 0),
+], ids=["median", "mean_fallback", "missing"])
+def test_center(section, expected):
+    """중앙값이 있으면 중앙값, 없으면 평균을 기준값으로 사용."""
+    assert _center(section, "files_per_sec", "median_files_per_sec") == expected
+
+
+@pytest.mark.parametrize("section,center,expected", [
+    ({"tolerance": 0.05}, 100.0, 0.05),  # runs 없음
+    ({"tolerance": 0.05, "runs": [{"throughput": 100.0}]}, 100.0, 0.05),  # 실행 1회
+    (
+        {"tolerance": 0.05, "runs": [{"throughput": v} for v in (99.0, 100.0, 101.0)]},
+        100.0,
+        0.05,  # 2 * MAD / 중앙값 = 0.02 < 0.05
+    ),
+    (
+        {"tolerance": 0.05, "runs": [{"throughput": v} for v in (90.0, 100.0, 110.0)]},
+        100.0,
+        0.2,  # 2 * MAD / 중앙값 = 2 * 10 / 100
+    ),
+    ({"runs": [{"throughput": v} for v in (90.0, 100.0, 110.0)]}, 0.0, 0.05),  # 기준값 0
+], ids=["no_runs", "single_run", "stable", "noisy", "zero_center"])
+def test_effective_tolerance(section, center, expected):
+    """실행 간 편차가 클 때만 허용 오차를 넓힌다."""
+    assert _effective_tolerance(section, "throughput", center) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("measured,tolerance,env,expected", [
+    (104.0, 0.05, "ci", "ok"),
+    (106.0, 0.05, "ci", "warning"),
+    (111.0, 0.05, "ci", "error"),
+    (111.0, 0.05, "local", "warning"),
+    (94.0, 0.05, "ci", "warning"),  # 감소도 같은 기준
+    (106.0, 0.01, "ci", "warning"),  # 작은 허용 오차도 5%/10% 아래로 내려가지 않음
+    (111.0, 0.01, "ci", "error"),
+    (111.0, 0.2, "ci", "ok"),  # 넓어진 허용 오차: soft 20%, hard 40%
+    (125.0, 0.2, "ci", "warning"),
+    (141.0, 0.2, "ci", "error"),
+], ids=[
+    "within_floor", "soft_floor", "hard_floor", "hard_local", "decrease",
+    "small_tol_soft", "small_tol_hard", "wide_tol_ok", "wide_tol_soft", "wide_tol_hard",
+])
+def test_check_metric(measured, tolerance, env, expected):
+    """기준선 100 대비 차이율로 ok/warning/error 판정."""
+    lines: list[str] = []
+    
+    assert _check_metric("metric", measured, 100.0, tolerance, env, lines) == expected
+    assert lines
+
+
+def test_check_metric_zero_baseline():
+    """기준선이 0이면 판정 불가로 경고."""
+    lines: list[str] = []
+    
+    assert _check_metric("metric", 10.0, 0, 0.05, "ci", lines) == "warning"
+    assert "기준선이 0" in lines[0]
@@ -0,0 +1,27 @@
+"""ValueObject 생성/해시 비용 마이크로 벤치마크.
+
+pytest-benchmark가 설치된 경우에만 실행되며, 없으면 모듈 전체를 건너뛴다.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from domain.value_objects.preview_stats import PreviewStats
+
+
+_TOP_EXTENSIONS = {".txt": 70, ".md": 20, ".log": 10}
+
+pytestmark = pytest.mark.benchmark(group="value_objects", min_rounds=50, max_time=1.0)
+
+
+def test_bench_preview_stats_create(benchmark):
+    """PreviewStats 생성 비용."""
+    benchmark(PreviewStats, 100, _TOP_EXTENSIONS, 1024)
+
+
+def test_bench_preview_stats_hash(benchmark):
+    """PreviewStats 해시 비용 (캐시된 해시)."""
+    stats = PreviewStats(100, _TOP_EXTENSIONS, 1024)
+    
+    benchmark(hash, stats)
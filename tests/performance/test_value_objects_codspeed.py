@@ -0,0 +1,44 @@
+"""ValueObject 핫패스 CodSpeed 벤치마크.
+
+pytest-codspeed가 설치된 경우에만 실행되며, 없으면 모듈 전체를 건너뛴다.
+``--codspeed`` 옵션으로 실행하면 테스트 본문 전체가 측정된다.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_codspeed")
+
+from domain.value_objects.preview_stats import PreviewStats
+
+
+_TOP_EXTENSIONS = {".txt": 70, ".md": 20, ".log": 10}
+_MANY_EXTENSIONS = {f".e{i:03d}": i for i in range(100)}
+
+
+@pytest.mark.benchmark
+def test_ps_construct():
+    """PreviewStats 생성."""
+    PreviewStats(100, _TOP_EXTENSIONS, 1024)
+
+
+@pytest.mark.benchmark
+def test_ps_hash_in_set():
+    """PreviewStats 10k개를 set에 삽입 (해시 계산 포함)."""
+    _ = {PreviewStats(i, _TOP_EXTENSIONS, i) for i in range(10_000)}
+
+
+@pytest.mark.benchmark
+def test_ps_property_access():
+    """생성 시 계산된 파생 속성 접근."""
+    stats = PreviewStats(100, _TOP_EXTENSIONS, 1024)
+    for _ in range(1_000):
+        _ = stats.is_empty
+        _ = stats.has_size_estimate
+        _ = stats.extension_count
+
+
+@pytest.mark.benchmark
+def test_ps_top_extensions_large():
+    """확장자 100종에서 상위 5개 조회."""
+    stats = PreviewStats(5_000, _MANY_EXTENSIONS)
+    stats.get_top_extensions(5)